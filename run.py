@@ -16,15 +16,11 @@ Usage:
 import asyncio
 import os
 import sys
+from contextlib import contextmanager, redirect_stdout
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Callable, ContextManager, Optional, Protocol
 
-import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -33,11 +29,51 @@ load_dotenv()
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.config import get_settings
+
+BANNER = """
+╔══════════════════════════════════════════════════════════════╗
+║                                                              ║
+║   📊  MEET INSIGHTS                                          ║
+║   ─────────────────────────────────────────────────────────  ║
+║   Transform call transcripts into actionable insights        ║
+║                                                              ║
+╚══════════════════════════════════════════════════════════════╝
+    """
+
+
+def serve_dashboard(show_banner: Callable[[], None], echo: Callable[[str], None] = print):
+    """Start the dashboard without processing, announcing where it is served.
+    
+    Shared by the `serve-only` command and its fast path, which passes
+    plain print functions so typer and rich are never imported.
+    """
+    from src.config import get_settings
+    from src.outputs.web_dashboard import run_server
+    
+    show_banner()
+    settings = get_settings()
+    echo("✓ Starting web dashboard...")
+    echo(f"   URL: http://{settings.web_host}:{settings.web_port}")
+    echo("\n   Press Ctrl+C to stop\n")
+    run_server(host=settings.web_host, port=settings.web_port)
+
+
+if __name__ == "__main__" and sys.argv[1:] == ["serve-only"]:
+    serve_dashboard(lambda: print(BANNER))
+    sys.exit(0)
+
+import orjson
+import typer
+from rich.console import Console
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.table import Table
+from rich.text import Text
+
+# Heavy dependencies (LangChain, Google API client, FastAPI) are imported inside
+# the functions that use them so lightweight commands start quickly.
+from src.config import Settings, get_settings
 from src.loaders.file_loader import FileLoader
-from src.extractors.insight_extractor import InsightExtractor
-from src.outputs.google_docs import GoogleDocsOutput, MockGoogleDocsOutput
-from src.outputs.web_dashboard import update_dashboard, run_server, create_app
 
 # Initialize CLI
 app = typer.Typer(
@@ -51,168 +87,294 @@ console = Console()
 
 def print_banner():
     """Print application banner."""
-    banner = """
-╔══════════════════════════════════════════════════════════════╗
-║                                                              ║
-║   📊  MEET INSIGHTS                                          ║
-║   ─────────────────────────────────────────────────────────  ║
-║   Transform call transcripts into actionable insights        ║
-║                                                              ║
-╚══════════════════════════════════════════════════════════════╝
+    console.print(BANNER, style="bold cyan")
+
+
+SUMMARY_CATEGORIES = [
+    ("🚀 Product Recommendations", "product_recommendations"),
+    ("⭐ Positive Feedback", "positive_feedback"),
+    ("📣 Marketing Messaging", "marketing_messaging"),
+    ("📱 Social Messaging", "social_messaging"),
+    ("❓ FAQ Ideas", "faq_ideas"),
+    ("📝 Blog Topics", "blog_topics"),
+]
+
+
+class Reporter(Protocol):
+    """Destination for CLI progress and results.
+    
+    `message` takes rich markup. Lines passed with an `event` name are
+    machine-relevant; lines without one are terminal-only detail.
     """
-    console.print(banner, style="bold cyan")
+    
+    def stage(self, description: str) -> ContextManager: ...
+    
+    def message(self, text: str, event: Optional[str] = None, **data) -> None: ...
+    
+    def summary(self, insights, title: str = "Extraction Complete") -> None: ...
+    
+    def themes(self, rollup) -> None: ...
 
 
-def print_insights_summary(insights, title: str = "Extraction Complete"):
-    """Print a summary table of extracted insights."""
-    table = Table(title=f"📈 {title}", show_header=True, header_style="bold magenta")
-    table.add_column("Category", style="cyan")
-    table.add_column("Count", justify="right", style="green")
+class RichReporter:
+    """Render progress and results in the terminal with rich."""
+    
+    def __init__(self, console: Console):
+        self.console = console
+        # One spinner display shared by every pipeline stage
+        self.progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+            transient=True,
+        )
     
-    table.add_row("🚀 Product Recommendations", str(len(insights.product_recommendations.insights)))
-    table.add_row("⭐ Positive Feedback", str(len(insights.positive_feedback.insights)))
-    table.add_row("📣 Marketing Messaging", str(len(insights.marketing_messaging.insights)))
-    table.add_row("📱 Social Messaging", str(len(insights.social_messaging.insights)))
-    table.add_row("❓ FAQ Ideas", str(len(insights.faq_ideas.insights)))
-    table.add_row("📝 Blog Topics", str(len(insights.blog_topics.insights)))
-    table.add_row("─" * 25, "─" * 5)
-    table.add_row("Total Insights", str(insights.total_insights), style="bold")
+    def __enter__(self):
+        self.progress.start()
+        return self
     
-    console.print(table)
+    def __exit__(self, *exc_info):
+        self.progress.stop()
+    
+    @contextmanager
+    def stage(self, description: str):
+        """Show a spinner line for one pipeline stage, removing it when done."""
+        task = self.progress.add_task(description, total=None)
+        try:
+            yield task
+        finally:
+            self.progress.remove_task(task)
+    
+    def message(self, text: str, event: Optional[str] = None, **data):
+        self.console.print(text)
+    
+    def summary(self, insights, title: str = "Extraction Complete"):
+        """Print a summary table of extracted insights."""
+        table = Table(title=f"📈 {title}", show_header=True, header_style="bold magenta")
+        table.add_column("Category", style="cyan")
+        table.add_column("Count", justify="right", style="green")
+        
+        for label, field_name in SUMMARY_CATEGORIES:
+            table.add_row(label, str(len(getattr(insights, field_name).insights)))
+        table.add_row("─" * 25, "─" * 5)
+        table.add_row("Total Insights", str(insights.total_insights), style="bold")
+        
+        self.console.print(table)
+    
+    def themes(self, rollup):
+        """Print the top themes from a weekly rollup."""
+        self.console.print("\n[bold]🔥 Top Themes:[/bold]")
+        for i, theme in enumerate(rollup.top_themes[:5], 1):
+            self.console.print(f"   {i}. {theme.theme} ({theme.occurrence_count}x)")
+
+
+class JsonlReporter:
+    """Emit one JSON object per line for CI and other programmatic consumers."""
+    
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stdout
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        pass
+    
+    def _emit(self, payload: dict):
+        self.stream.write(orjson.dumps(payload).decode() + "\n")
+        self.stream.flush()
+    
+    @contextmanager
+    def stage(self, description: str):
+        self._emit({"event": "stage", "description": description})
+        yield
+    
+    def message(self, text: str, event: Optional[str] = None, **data):
+        if event is None:
+            return
+        self._emit({"event": event, "message": Text.from_markup(text).plain.strip(), **data})
+    
+    def summary(self, insights, title: str = "Extraction Complete"):
+        self._emit({
+            "event": "summary",
+            "counts": {
+                field_name: len(getattr(insights, field_name).insights)
+                for _, field_name in SUMMARY_CATEGORIES
+            },
+            "total": insights.total_insights,
+        })
+    
+    def themes(self, rollup):
+        self._emit({
+            "event": "themes",
+            "themes": [
+                {"theme": t.theme, "count": t.occurrence_count}
+                for t in rollup.top_themes[:5]
+            ],
+        })
 
 
 async def process_transcripts(
     data_dir: str,
+    reporter: Reporter,
     deduplicate: bool = True,
+    workers: Optional[int] = None,
+    use_cache: bool = True,
+    settings: Optional[Settings] = None,
+    on_result: Optional[Callable] = None,
+    on_extracted: Optional[Callable] = None,
 ) -> tuple:
-    """Load and process transcripts."""
-    settings = get_settings()
+    """Load and process transcripts.
+    
+    `on_result` receives each transcript's insights as soon as they are extracted.
+    `on_extracted` receives the merged insights and runs in a worker thread while
+    the weekly rollup is generated, so output setup overlaps the LLM call.
+    """
+    from src.extractors.insight_extractor import InsightExtractor
+    
+    settings = settings or get_settings()
     
     # Load transcripts
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Loading transcripts...", total=None)
-        
-        loader = FileLoader(data_dir=data_dir)
-        collection = loader.load_all()
-        
-        progress.update(task, description=f"Loaded {collection.total_calls} transcripts")
+    with reporter.stage("Loading transcripts..."):
+        loader = FileLoader(data_dir=data_dir, workers=workers)
+        # Parsing is blocking work; keep the event loop (and spinner) responsive
+        collection = await asyncio.to_thread(loader.load_all)
     
     if collection.total_calls == 0:
-        console.print("[yellow]⚠️  No transcripts found in data directory[/yellow]")
-        console.print(f"   Looking in: {data_dir}")
-        console.print("   Add JSON, TXT, or PDF transcript files to process.")
+        reporter.message(
+            "[yellow]⚠️  No transcripts found in data directory[/yellow]",
+            event="error", data_dir=data_dir,
+        )
+        reporter.message(f"   Looking in: {data_dir}")
+        reporter.message("   Add JSON, TXT, or PDF transcript files to process.")
         return None, None
     
-    console.print(f"\n[green]✓[/green] Found {collection.total_calls} transcripts")
-    console.print(f"  Reps: {', '.join(collection.reps)}")
-    if collection.companies:
-        console.print(f"  Companies: {', '.join(collection.companies)}")
+    # Each property walks every transcript, so read them once
+    reps = collection.reps
+    companies = collection.companies
+    reporter.message(
+        f"\n[green]✓[/green] Found {collection.total_calls} transcripts",
+        event="loaded",
+        transcripts=collection.total_calls,
+        reps=reps,
+        companies=companies,
+    )
+    reporter.message(f"  Reps: {', '.join(reps)}")
+    if companies:
+        reporter.message(f"  Companies: {', '.join(companies)}")
     
-        # Extract insights
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Extracting insights with AI...", total=None)
-            
-            # Setup project name for LangSmith tracing
-            project_name = None
-            if settings.langchain_tracing_v2:
-                project_name = settings.langchain_project or "meet-insights"
-            
-            extractor = InsightExtractor(
-                model_name=settings.openai_model,
-                project_name=project_name,
-            )
-            result = await extractor.extract_from_collection(
-                collection, 
-                deduplicate=deduplicate
-            )
-            
-            progress.update(task, description="Extraction complete!")
+    # Extract insights
+    with reporter.stage("Extracting insights with AI..."):
+        # Setup project name for LangSmith tracing
+        project_name = None
+        if settings.langchain_tracing_v2:
+            project_name = settings.langchain_project or "meet-insights"
+        
+        extractor = InsightExtractor(
+            model_name=settings.openai_model,
+            project_name=project_name,
+            max_concurrency=settings.max_concurrent_llm,
+            use_cache=use_cache,
+            cache_dir=settings.cache_dir,
+            cache_threshold=settings.semantic_cache_threshold,
+            semantic_dedup=settings.semantic_dedup,
+        )
+        result = await extractor.extract_from_collection(
+            collection, 
+            deduplicate=deduplicate,
+            on_result=on_result,
+        )
     
-    console.print(f"\n[green]✓[/green] Processed in {result.processing_time_seconds:.1f} seconds")
+    reporter.message(
+        f"\n[green]✓[/green] Processed in {result.processing_time_seconds:.1f} seconds",
+        event="extracted",
+        seconds=result.processing_time_seconds,
+        total_insights=result.insights.total_insights,
+    )
     
     # Generate weekly rollup if multiple calls
     rollup = None
+    rollup_task = None
     if len(result.insights.call_ids) > 1:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Generating weekly rollup...", total=None)
-            
-            week_end = datetime.now()
-            week_start = week_end - timedelta(days=7)
-            
+        week_end = datetime.now()
+        week_start = week_end - timedelta(days=7)
+        rollup_task = asyncio.create_task(extractor.generate_weekly_rollup(
+            result.insights,
+            week_start,
+            week_end,
+        ))
+    
+    if rollup_task is None and on_extracted is None:
+        return result.insights, None
+    
+    description = "Generating weekly rollup..." if rollup_task else "Preparing outputs..."
+    with reporter.stage(description):
+        try:
+            if on_extracted is not None:
+                await asyncio.to_thread(on_extracted, result.insights)
+        except BaseException:
+            # Don't leave the rollup running (and its error unretrieved)
+            if rollup_task is not None:
+                rollup_task.cancel()
+                await asyncio.gather(rollup_task, return_exceptions=True)
+            raise
+        
+        if rollup_task is not None:
             try:
-                rollup = await extractor.generate_weekly_rollup(
-                    result.insights,
-                    week_start,
-                    week_end,
-                )
-                progress.update(task, description="Rollup generated!")
+                rollup = await rollup_task
             except Exception as e:
-                console.print(f"[yellow]⚠️  Could not generate rollup: {e}[/yellow]")
+                reporter.message(
+                    f"[yellow]⚠️  Could not generate rollup: {e}[/yellow]",
+                    event="warning",
+                )
     
     return result.insights, rollup
 
 
 async def process_single_file(
     file_path: str,
+    reporter: Reporter,
     rep_name: str = "Unknown Rep",
     company_name: Optional[str] = None,
+    use_cache: bool = True,
+    settings: Optional[Settings] = None,
 ) -> tuple:
     """Load and process a single transcript file (PDF, TXT, or JSON)."""
-    settings = get_settings()
+    from src.extractors.insight_extractor import InsightExtractor
+    
+    settings = settings or get_settings()
     
     file_path_obj = Path(file_path)
+    file_name = file_path_obj.name
     
     # Load single file
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"Loading {file_path_obj.name}...", total=None)
-        
+    with reporter.stage(f"Loading {file_name}..."):
         loader = FileLoader()
         try:
-            transcript = loader.load_single_file(
+            transcript = await asyncio.to_thread(
+                loader.load_single_file,
                 file_path_obj,
                 rep_name=rep_name,
                 company_name=company_name,
             )
         except Exception as e:
-            console.print(f"[red]✗[/red] Failed to load file: {e}")
+            reporter.message(f"[red]✗[/red] Failed to load file: {e}", event="error")
             return None, None
-        
-        # Wrap in a collection for consistent processing
-        from src.models.transcript import TranscriptCollection
-        collection = TranscriptCollection(transcripts=[transcript])
-        
-        progress.update(task, description=f"Loaded: {file_path_obj.name}")
     
-    console.print(f"\n[green]✓[/green] Loaded transcript: {file_path_obj.name}")
-    console.print(f"  Rep: {transcript.metadata.rep_name}")
+    reporter.message(
+        f"\n[green]✓[/green] Loaded transcript: {file_name}",
+        event="loaded",
+        transcripts=1,
+        reps=[transcript.metadata.rep_name],
+        companies=[transcript.metadata.company_name] if transcript.metadata.company_name else [],
+    )
+    reporter.message(f"  Rep: {transcript.metadata.rep_name}")
     if transcript.metadata.company_name:
-        console.print(f"  Company: {transcript.metadata.company_name}")
-    console.print(f"  Text length: {len(transcript.full_text):,} characters")
+        reporter.message(f"  Company: {transcript.metadata.company_name}")
+    reporter.message(f"  Text length: {len(transcript.full_text):,} characters")
     
     # Extract insights
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Extracting insights with AI...", total=None)
-        
+    with reporter.stage("Extracting insights with AI..."):
         # Setup project name for LangSmith tracing
         project_name = None
         if settings.langchain_tracing_v2:
@@ -221,84 +383,130 @@ async def process_single_file(
         extractor = InsightExtractor(
             model_name=settings.openai_model,
             project_name=project_name,
+            use_cache=use_cache,
+            cache_dir=settings.cache_dir,
+            cache_threshold=settings.semantic_cache_threshold,
         )
         result = await extractor.extract_from_transcript(transcript)
-        
-        progress.update(task, description="Extraction complete!")
     
-    console.print(f"\n[green]✓[/green] Processed in {result.processing_time_seconds:.1f} seconds")
+    reporter.message(
+        f"\n[green]✓[/green] Processed in {result.processing_time_seconds:.1f} seconds",
+        event="extracted",
+        seconds=result.processing_time_seconds,
+        total_insights=result.insights.total_insights,
+    )
     
     return result.insights, None  # No rollup for single file
 
 
-def output_to_markdown(insights, rollup, output_path: str = "output/insights.md"):
+def ensure_dir(path: str) -> Path:
+    """Create a directory if it is missing and return it."""
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def output_to_markdown(insights, rollup, reporter: Reporter, output_path: str = "output/insights.md"):
     """Output insights to a markdown file."""
-    output_dir = Path(output_path).parent
-    output_dir.mkdir(parents=True, exist_ok=True)
+    from src.outputs.google_docs import MockGoogleDocsOutput
+    
+    ensure_dir(os.path.dirname(output_path) or ".")
     
     mock_docs = MockGoogleDocsOutput()
     doc_id = mock_docs.write_insights(insights, weekly_rollup=rollup)
     mock_docs.save_to_file(doc_id, output_path)
     
-    console.print(f"\n[green]✓[/green] Saved to: {output_path}")
+    reporter.message(
+        f"\n[green]✓[/green] Saved to: {output_path}",
+        event="output", destination="markdown", path=output_path,
+    )
     return output_path
 
 
-def output_to_google_docs(insights, rollup) -> Optional[str]:
-    """Output insights to Google Docs using OAuth 2.0."""
-    settings = get_settings()
+def connect_google_docs(settings: Settings):
+    """Authenticate with Google and return a ready GoogleDocsOutput."""
+    from src.outputs.google_docs import GoogleDocsOutput
+    
+    return GoogleDocsOutput(folder_id=settings.google_doc_folder_id)
 
+
+def output_to_google_docs(
+    insights,
+    rollup,
+    settings: Settings,
+    reporter: Reporter,
+    docs_output=None,
+) -> Optional[str]:
+    """Output insights to Google Docs using OAuth 2.0.
+    
+    Pass `docs_output` to reuse a client that was authenticated ahead of time.
+    """
     try:
-        docs_output = GoogleDocsOutput(
-            folder_id=settings.google_doc_folder_id,
-        )
+        if docs_output is None:
+            docs_output = connect_google_docs(settings)
         
         # Check if authentication succeeded
         if not docs_output.docs_service:
-            console.print("[yellow]⚠️  Google authentication failed[/yellow]")
-            console.print("   Make sure Docs & Drive APIs are enabled and your OAuth client JSON is valid.")
-            console.print("\n   Falling back to local markdown output...")
-            return output_to_markdown(insights, rollup)
+            reporter.message("[yellow]⚠️  Google authentication failed[/yellow]", event="warning")
+            reporter.message("   Make sure Docs & Drive APIs are enabled and your OAuth client JSON is valid.")
+            reporter.message("\n   Falling back to local markdown output...")
+            return output_to_markdown(insights, rollup, reporter)
         
         doc_id = docs_output.write_insights(insights, weekly_rollup=rollup)
         doc_url = docs_output.get_document_url(doc_id)
         
-        console.print(f"\n[green]✓[/green] Created Google Doc")
-        console.print(f"   URL: {doc_url}")
+        reporter.message(
+            f"\n[green]✓[/green] Created Google Doc",
+            event="output", destination="docs", url=doc_url,
+        )
+        reporter.message(f"   URL: {doc_url}")
 
         if docs_output.get_user_email():
-            console.print(f"   Created by: {docs_output.get_user_email()}")
+            reporter.message(f"   Created by: {docs_output.get_user_email()}")
         
         return doc_url
     except Exception as e:
         error_msg = str(e)
-        console.print(f"[red]✗[/red] Google Docs error: {e}")
+        reporter.message(f"[red]✗[/red] Google Docs error: {e}", event="error")
         
         # Provide helpful guidance for 403 errors
         if "403" in error_msg or "permission" in error_msg.lower():
-            console.print("\n[yellow]💡 This is a permission error. Common fixes:[/yellow]")
+            reporter.message("\n[yellow]💡 This is a permission error. Common fixes:[/yellow]")
 
-            console.print("   1. Enable Google Docs API and Google Drive API for your project")
-            console.print("      → https://console.cloud.google.com/apis/library/docs.googleapis.com")
-            console.print("      → https://console.cloud.google.com/apis/library/drive.googleapis.com")
+            reporter.message("   1. Enable Google Docs API and Google Drive API for your project")
+            reporter.message("      → https://console.cloud.google.com/apis/library/docs.googleapis.com")
+            reporter.message("      → https://console.cloud.google.com/apis/library/drive.googleapis.com")
 
-            console.print("\n   2. Make sure the folder (if configured) is shared with your account")
-            console.print("      → Check GOOGLE_DOC_FOLDER_ID in your .env")
+            reporter.message("\n   2. Make sure the folder (if configured) is shared with your account")
+            reporter.message("      → Check GOOGLE_DOC_FOLDER_ID in your .env")
 
-        console.print("\n   Falling back to local markdown output...")
-        return output_to_markdown(insights, rollup)
+        reporter.message("\n   Falling back to local markdown output...")
+        return output_to_markdown(insights, rollup, reporter)
 
 
-def start_web_dashboard(insights, rollup):
-    """Start the web dashboard."""
-    settings = get_settings()
+def start_web_dashboard(insights, rollup, settings: Settings, reporter: Reporter, server=None):
+    """Start the web dashboard, or keep serving one already started in the background."""
+    from src.outputs.web_dashboard import update_dashboard, run_server
     
     # Update dashboard with insights
     update_dashboard(insights, rollup)
     
-    console.print(f"\n[green]✓[/green] Starting web dashboard...")
-    console.print(f"   URL: http://{settings.web_host}:{settings.web_port}")
-    console.print("\n   Press Ctrl+C to stop\n")
+    if server is not None:
+        reporter.message(
+            f"\n[green]✓[/green] Web dashboard updated with final results",
+            event="output", destination="web", url=f"http://{settings.web_host}:{settings.web_port}",
+        )
+        reporter.message(f"   URL: http://{settings.web_host}:{settings.web_port}")
+        reporter.message("\n   Press Ctrl+C to stop\n")
+        server.wait()
+        return
+    
+    reporter.message(
+        f"\n[green]✓[/green] Starting web dashboard...",
+        event="output", destination="web", url=f"http://{settings.web_host}:{settings.web_port}",
+    )
+    reporter.message(f"   URL: http://{settings.web_host}:{settings.web_port}")
+    reporter.message("\n   Press Ctrl+C to stop\n")
     
     run_server(host=settings.web_host, port=settings.web_port)
 
@@ -336,11 +544,27 @@ def main(
         "--no-dedupe",
         help="Disable insight deduplication"
     ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always call the LLM instead of reusing cached extractions"
+    ),
+    workers: Optional[int] = typer.Option(
+        None,
+        "--workers", "-w",
+        help="Number of workers used to load transcript files (threads, or processes for large directories)"
+    ),
     serve: bool = typer.Option(
         True,
         "--serve/--no-serve",
         help="Start web server after processing (for web output)"
     ),
+    json_output: bool = typer.Option(
+        False,
+        "--json",
+        envvar="MEET_INSIGHTS_JSON",
+        help="Emit JSON lines instead of rich terminal output"
+    ),
 ):
     """
     Process call transcripts and extract categorized insights.
@@ -360,80 +584,143 @@ def main(
         python run.py -o both                  # Output to both docs and web
         
         python run.py -d /path/to/calls        # Use custom data directory
+        
+        python run.py -o markdown --json       # Machine-readable progress
     """
     # If a subcommand was invoked, don't run main processing
     if ctx.invoked_subcommand is not None:
         return
-    print_banner()
     
+    if json_output:
+        reporter = JsonlReporter()
+        # Keep stray print() output from libraries out of the JSON stream
+        with redirect_stdout(sys.stderr):
+            run_pipeline(reporter, output, data_dir, file, rep_name, company_name,
+                         no_dedupe, no_cache, workers, serve)
+    else:
+        print_banner()
+        run_pipeline(RichReporter(console), output, data_dir, file, rep_name, company_name,
+                     no_dedupe, no_cache, workers, serve)
+
+
+def run_pipeline(
+    reporter: Reporter,
+    output: str,
+    data_dir: str,
+    file: Optional[str],
+    rep_name: str,
+    company_name: Optional[str],
+    no_dedupe: bool,
+    no_cache: bool,
+    workers: Optional[int],
+    serve: bool,
+):
+    """Process transcripts and deliver insights to the selected outputs."""
     # Check for API key
     settings = get_settings()
     if not settings.openai_api_key:
-        console.print("[red]✗[/red] OPENAI_API_KEY not set!")
-        console.print("   Copy .env.example to .env and add your API key")
+        reporter.message("[red]✗[/red] OPENAI_API_KEY not set!", event="error")
+        reporter.message("   Copy .env.example to .env and add your API key")
         raise typer.Exit(1)
     
+    output = output.lower()
+    
+    # In directory mode, serve the dashboard while processing so each call's
+    # insights show up as soon as it finishes
+    server = None
+    on_result = None
+    if output in ("web", "both") and serve and not file:
+        from src.outputs.web_dashboard import DashboardServer, update_dashboard_incremental
+        
+        server = DashboardServer(host=settings.web_host, port=settings.web_port)
+        server.start()
+        on_result = update_dashboard_incremental
+        reporter.message(
+            f"[green]✓[/green] Live dashboard: http://{settings.web_host}:{settings.web_port}",
+            event="dashboard", url=f"http://{settings.web_host}:{settings.web_port}",
+        )
+    
+    # Authenticate before the progress display starts, since Google's OAuth
+    # flow may prompt in the terminal or open a browser
+    docs_output = None
+    if output in ("docs", "both"):
+        try:
+            docs_output = connect_google_docs(settings)
+        except Exception:
+            pass  # output_to_google_docs retries and reports the error
+    
+    # Work that only needs the merged insights runs while the rollup is generated
+    prepare_outputs = None
+    if server is not None:
+        def prepare_outputs(merged_insights):
+            from src.outputs.web_dashboard import update_dashboard
+            
+            # Show the deduplicated results now; the rollup follows. The
+            # final update records the run, so this one stays out of history.
+            update_dashboard(merged_insights, None, record_history=False)
+    
     # Process transcripts - either single file or directory
     try:
-        if file:
-            # Single file mode
-            console.print(f"[cyan]📄 Single file mode:[/cyan] {file}")
-            insights, rollup = asyncio.run(process_single_file(
-                file_path=file,
-                rep_name=rep_name,
-                company_name=company_name,
-            ))
-        else:
-            # Directory mode (default)
-            insights, rollup = asyncio.run(process_transcripts(
-                data_dir=data_dir,
-                deduplicate=not no_dedupe,
-            ))
+        with reporter:
+            if file:
+                # Single file mode
+                reporter.message(f"[cyan]📄 Single file mode:[/cyan] {file}")
+                insights, rollup = asyncio.run(process_single_file(
+                    file_path=file,
+                    reporter=reporter,
+                    rep_name=rep_name,
+                    company_name=company_name,
+                    use_cache=not no_cache,
+                    settings=settings,
+                ))
+            else:
+                # Directory mode (default)
+                insights, rollup = asyncio.run(process_transcripts(
+                    data_dir=data_dir,
+                    reporter=reporter,
+                    deduplicate=not no_dedupe,
+                    workers=workers,
+                    use_cache=not no_cache,
+                    settings=settings,
+                    on_result=on_result,
+                    on_extracted=prepare_outputs,
+                ))
     except Exception as e:
-        console.print(f"[red]✗[/red] Processing error: {e}")
+        reporter.message(f"[red]✗[/red] Processing error: {e}", event="error")
         raise typer.Exit(1)
     
     if insights is None:
         raise typer.Exit(1)
     
     # Print summary
-    print_insights_summary(insights)
+    reporter.summary(insights)
     
     # Print top themes if rollup available
     if rollup and rollup.top_themes:
-        console.print("\n[bold]🔥 Top Themes:[/bold]")
-        for i, theme in enumerate(rollup.top_themes[:5], 1):
-            console.print(f"   {i}. {theme.theme} ({theme.occurrence_count}x)")
+        reporter.themes(rollup)
     
     # Output based on selection
-    output = output.lower()
-    
     if output in ("docs", "both"):
-        output_to_google_docs(insights, rollup)
+        output_to_google_docs(insights, rollup, settings, reporter, docs_output=docs_output)
     
     if output in ("markdown",):
-        output_to_markdown(insights, rollup)
+        output_to_markdown(insights, rollup, reporter)
     
     if output in ("web", "both"):
         if serve:
-            start_web_dashboard(insights, rollup)
+            start_web_dashboard(insights, rollup, settings, reporter, server=server)
         else:
+            from src.outputs.web_dashboard import update_dashboard
+            
             update_dashboard(insights, rollup)
-            console.print("\n[green]✓[/green] Dashboard updated")
-            console.print("   Run with --serve to start the web server")
+            reporter.message("\n[green]✓[/green] Dashboard updated", event="output", destination="web")
+            reporter.message("   Run with --serve to start the web server")
 
 
 @app.command()
 def serve_only():
     """Start the web dashboard without processing (show existing data)."""
-    print_banner()
-    settings = get_settings()
-    
-    console.print(f"[green]✓[/green] Starting web dashboard...")
-    console.print(f"   URL: http://{settings.web_host}:{settings.web_port}")
-    console.print("\n   Press Ctrl+C to stop\n")
-    
-    run_server(host=settings.web_host, port=settings.web_port)
+    serve_dashboard(print_banner, console.print)
 
 
 @app.command()
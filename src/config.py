@@ -1,14 +1,23 @@
 """Configuration management for Meet Insights."""
 
 import os
+from functools import lru_cache
 from typing import Optional
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
 
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
+    # Frozen: the instance is cached and shared process-wide by get_settings()
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+        frozen=True,
+    )
+    
     # OpenAI
     openai_api_key: str = Field(
         default="",
@@ -58,10 +67,28 @@ class Settings(BaseSettings):
         default=True,
         description="Enable insight deduplication"
     )
+    semantic_dedup: bool = Field(
+        default=False,
+        description="Also drop paraphrased duplicates using embeddings"
+    )
     confidence_threshold: str = Field(
         default="medium",
         description="Minimum confidence threshold"
     )
+    max_concurrent_llm: int = Field(
+        default=5,
+        description="Maximum number of concurrent LLM extraction requests"
+    )
+    
+    # Caching
+    cache_dir: str = Field(
+        default="~/.cache/meet-insights",
+        description="Directory for cached extraction results"
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.92,
+        description="Cosine similarity above which a cached extraction is reused"
+    )
     
     # Data
     data_dir: str = Field(
@@ -86,14 +113,14 @@ class Settings(BaseSettings):
         default=False,
         description="Enable verbose LangSmith tracing"
     )
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings.
+
+    The instance is cached so `.env` is only parsed once per process.
+    Call `get_settings.cache_clear()` after changing environment variables.
+    """
     return Settings()
 
@@ -1,6 +1,7 @@
 """Insight extraction using LangChain and LLMs."""
 
 from .insight_extractor import InsightExtractor, InsightExtractionResult
+from .result_cache import ResultCache
+from .semantic_cache import SemanticCache
 
-__all__ = ["InsightExtractor", "InsightExtractionResult"]
-
+__all__ = ["InsightExtractor", "InsightExtractionResult", "ResultCache", "SemanticCache"]
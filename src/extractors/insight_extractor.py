@@ -1,20 +1,26 @@
 """LangChain-based insight extractor with structured output."""
 
+import asyncio
 import os
+import time
 from datetime import datetime
-from typing import Optional
+from itertools import islice
+from pathlib import Path
+from typing import Callable, NamedTuple, Optional
 import hashlib
 import re
-from difflib import SequenceMatcher
 
-from langchain_openai import ChatOpenAI
+import tiktoken
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import RunnableConfig
 from pydantic import BaseModel, Field
+from rapidfuzz import fuzz, process
 
-from ..models.transcript import Transcript, TranscriptCollection
+from ..models.transcript import Transcript, TranscriptCollection, TranscriptSegment
 from ..models.insights import (
     CallInsights,
+    InsightCategory,
     Insight,
     SourceReference,
     ConfidenceLevel,
@@ -27,6 +33,35 @@ from ..models.insights import (
     WeeklyRollup,
     ThemeSummary,
 )
+from .result_cache import ResultCache
+from .semantic_cache import SemanticCache
+
+# Quote normalization patterns, compiled once for the quote-matching hot path
+_QUOTES_RE = re.compile(r"[\u2018\u2019\u201c\u201d]")
+_NONALNUM_RE = re.compile(r"[^a-z0-9\s]")
+_WS_RE = re.compile(r"\s+")
+
+# LangSmith tags. Tuples so they can't be mutated; LangChain merges tags as
+# lists, so each config gets a list copy.
+_EXTRACTION_TAGS = ("insight-extraction", "transcript-analysis")
+_ROLLUP_TAGS = ("weekly-rollup", "theme-analysis")
+
+# Category labels used for the rollup's per-category counts
+_ROLLUP_CATEGORY_LABELS = {
+    InsightCategory.PRODUCT_RECOMMENDATIONS: "Product Recommendations",
+    InsightCategory.POSITIVE_FEEDBACK: "Positive Feedback",
+    InsightCategory.MARKETING_MESSAGING: "Marketing Messaging",
+    InsightCategory.SOCIAL_MESSAGING: "Social Messaging",
+    InsightCategory.FAQ_IDEAS: "FAQ Ideas",
+    InsightCategory.BLOG_TOPICS: "Blog Topics",
+}
+
+
+class _SegmentIndex(NamedTuple):
+    """A transcript's segments prepared for quote matching."""
+    segments: list[TranscriptSegment]
+    normalized: list[str]
+    matches: dict[str, Optional[TranscriptSegment]]  # normalized quote -> segment
 
 
 class ExtractedInsightItem(BaseModel):
@@ -67,6 +102,11 @@ class AllCategoryInsights(BaseModel):
     )
 
 
+class ThemeAnalysis(BaseModel):
+    """Recurring themes identified for a weekly rollup."""
+    themes: list[ThemeSummary] = Field(description="Top 5 recurring themes")
+
+
 class InsightExtractionResult(BaseModel):
     """Result of insight extraction."""
     insights: CallInsights
@@ -124,11 +164,20 @@ Return a structured analysis of the top 5 most important/frequent themes.
         model_name: Optional[str] = None,
         temperature: float = 0.3,
         max_tokens: int = 4000,
+        max_transcript_tokens: int = 3750,
         project_name: Optional[str] = None,
+        max_concurrency: int = 5,
+        use_cache: bool = False,
+        cache_dir: str = "~/.cache/meet-insights",
+        cache_threshold: float = 0.92,
+        semantic_dedup: bool = False,
     ):
         self.model_name = model_name or os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.max_transcript_tokens = max_transcript_tokens
+        self._encoding = None  # Loaded on first use; False if unavailable
+        self.max_concurrency = max(1, max_concurrency)
         
         # Setup LangSmith tracing if enabled
         self._setup_langsmith(project_name)
@@ -140,9 +189,39 @@ Return a structured analysis of the top 5 most important/frequent themes.
             max_tokens=self.max_tokens,
         )
         
-        # Use with_structured_output for reliable structured parsing
-        # This uses OpenAI's native structured output when available
+        # Use with_structured_output for reliable structured parsing.
+        # A single schema covers all six categories, so each transcript costs
+        # one round-trip rather than one per category.
         self.llm = self.llm_base.with_structured_output(AllCategoryInsights)
+        
+        # Build the chains once; every transcript and rollup reuses them.
+        # Chain with structured output - LLM returns Pydantic model directly
+        self.extraction_prompt = ChatPromptTemplate.from_template(self.EXTRACTION_PROMPT)
+        self.extraction_chain = self.extraction_prompt | self.llm
+        
+        # A separate structured-output binding for theme analysis
+        self.rollup_chain = (
+            ChatPromptTemplate.from_template(self.ROLLUP_PROMPT)
+            | self.llm_base.with_structured_output(ThemeAnalysis)
+        )
+        
+        # Embeddings back both the semantic cache and paraphrase deduplication
+        self.semantic_dedup = semantic_dedup
+        self.embeddings: Optional[OpenAIEmbeddings] = None
+        if use_cache or semantic_dedup:
+            self.embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
+        
+        # Optional caches: exact transcript matches first, then near-duplicates
+        self.result_cache: Optional[ResultCache] = None
+        self.semantic_cache: Optional[SemanticCache] = None
+        if use_cache:
+            self.result_cache = ResultCache(Path(cache_dir) / "results")
+            self.semantic_cache = SemanticCache(
+                Path(cache_dir) / "semantic_index.jsonl",
+                embeddings=self.embeddings,
+                threshold=cache_threshold,
+                model_name=self.model_name,
+            )
     
     def _setup_langsmith(self, project_name: Optional[str] = None):
         """Setup LangSmith tracing if enabled via environment variables."""
@@ -165,52 +244,105 @@ Return a structured analysis of the top 5 most important/frequent themes.
             
             print(f"✅ LangSmith tracing enabled (project: {os.getenv('LANGCHAIN_PROJECT')})")
     
+    def _get_encoding(self):
+        """Load the model's tokenizer, or return None if it can't be loaded."""
+        if self._encoding is None:
+            try:
+                self._encoding = tiktoken.encoding_for_model(self.model_name)
+            except KeyError:
+                self._encoding = self._load_fallback_encoding()
+            except Exception:
+                self._encoding = False  # BPE files unreachable (e.g. offline)
+        return self._encoding or None
+    
+    def _load_fallback_encoding(self):
+        try:
+            return tiktoken.get_encoding("o200k_base")
+        except Exception:
+            return False
+    
+    def _truncate_transcript(self, text: str) -> str:
+        """Trim transcript text to the input token budget."""
+        limit = self.max_transcript_tokens
+        if len(text) <= limit:  # Every token covers at least one character
+            return text
+        
+        encoding = self._get_encoding()
+        if encoding is None:
+            return text[:limit * 4]  # Roughly four characters per token
+        
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= limit:
+            return text
+        return encoding.decode(tokens[:limit])
+    
     def _generate_insight_id(self, content: str, call_id: str) -> str:
-        """Generate unique ID for an insight for deduplication."""
-        hash_input = f"{content[:50]}:{call_id}"
-        return hashlib.md5(hash_input.encode()).hexdigest()[:12]
+        """Generate unique ID for an insight for deduplication.
+        
+        Hashes the whole content, case- and whitespace-normalized, so long
+        insights that only differ after a shared opening stay distinct.
+        """
+        hash_input = f"{' '.join(content.lower().split())}:{call_id}"
+        return hashlib.blake2b(hash_input.encode(), digest_size=6).hexdigest()
     
     def _normalize_for_match(self, s: str) -> str:
         """Normalize text for fuzzy matching."""
         s = s.lower()
-        s = re.sub(r"[\u2018\u2019\u201c\u201d]", '"', s)  # curly quotes to straight-ish
-        s = re.sub(r"[^a-z0-9\s]", " ", s)
-        s = re.sub(r"\s+", " ", s).strip()
+        s = _QUOTES_RE.sub('"', s)  # curly quotes to straight-ish
+        s = _NONALNUM_RE.sub(" ", s)
+        s = _WS_RE.sub(" ", s).strip()
         return s
 
-    def _best_segment_for_quote(self, transcript: Transcript, quote: str):
-        """Find the best matching transcript segment for a quote."""
-        if not quote or not transcript.segments:
+    def _index_segments(self, transcript: Transcript) -> _SegmentIndex:
+        """Normalize segment text once so every quote lookup can reuse it."""
+        segments = [seg for seg in transcript.segments if seg.text]
+        return _SegmentIndex(
+            segments=segments,
+            normalized=[self._normalize_for_match(seg.text) for seg in segments],
+            matches={},
+        )
+
+    def _best_segment_for_quote(self, segment_index: _SegmentIndex, quote: str):
+        """Find the best matching transcript segment for a quote.
+
+        Args:
+            segment_index: Prepared segments from `_index_segments`
+            quote: Quote returned by the LLM
+        """
+        if not quote or not segment_index.segments:
             return None
 
         qn = self._normalize_for_match(quote)
         if not qn:
             return None
 
-        best = None
-        best_score = 0.0
-
-        for seg in transcript.segments:
-            if not seg.text:
-                continue
-            sn = self._normalize_for_match(seg.text)
-            if not sn:
-                continue
-
-            # Prefer direct containment (high confidence)
-            if qn in sn or sn in qn:
-                score = 1.0
-            else:
-                score = SequenceMatcher(None, qn, sn).ratio()
-
-            if score > best_score:
-                best_score = score
-                best = seg
-
-        # Heuristic threshold: only accept decent matches
-        if best_score >= 0.55:
-            return best
-        return None
+        # The same quote often backs insights in several categories
+        if qn not in segment_index.matches:
+            segment_index.matches[qn] = self._match_segment(segment_index, qn)
+        return segment_index.matches[qn]
+
+    def _match_segment(self, segment_index: _SegmentIndex, qn: str):
+        """Scan the segments for the best match to a normalized quote."""
+        segments, normalized = segment_index.segments, segment_index.normalized
+
+        # Most quotes come back verbatim, so try plain containment first
+        for seg, sn in zip(segments, normalized):
+            if sn and (qn in sn or sn in qn):
+                return seg
+
+        # Fall back to whole-string similarity (containment is handled above).
+        # partial_ratio would let short filler like "yeah" score high against
+        # any quote sharing a few letters.
+        match = process.extractOne(
+            qn,
+            normalized,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=55,
+        )
+        if match is None:
+            return None
+        return segments[match[2]]
 
     def _map_confidence(self, conf_str: str) -> ConfidenceLevel:
         """Map string confidence to enum."""
@@ -225,13 +357,16 @@ Return a structured analysis of the top 5 most important/frequent themes.
         self,
         extracted: list[ExtractedInsightItem],
         transcript: Transcript,
+        segment_index: Optional[_SegmentIndex] = None,
     ) -> list[Insight]:
         """Convert extracted items to Insight models."""
+        if segment_index is None:
+            segment_index = self._index_segments(transcript)
         insights = []
         for item in extracted:
             matched_segment = None
             if item.direct_quote:
-                matched_segment = self._best_segment_for_quote(transcript, item.direct_quote)
+                matched_segment = self._best_segment_for_quote(segment_index, item.direct_quote)
 
             speaker_name = matched_segment.speaker_name if matched_segment else None
             timestamp = None
@@ -261,94 +396,185 @@ Return a structured analysis of the top 5 most important/frequent themes.
         
         return insights
     
+    def _rebind_to_transcript(
+        self,
+        insights: CallInsights,
+        transcript: Transcript,
+        rematch_quotes: bool = False,
+    ) -> CallInsights:
+        """Point cached insights at the transcript they are being reused for.
+        
+        With `rematch_quotes`, used for near-duplicate hits that came from
+        another call, each quote is looked up again in this transcript. Quotes
+        that aren't found are dropped along with their speaker and timestamp.
+        """
+        metadata = transcript.metadata
+        segment_index = self._index_segments(transcript) if rematch_quotes else None
+        for category in InsightCategory:
+            for insight in insights.get_category(category).insights:
+                insight.source.call_id = metadata.call_id
+                insight.source.call_date = metadata.call_date
+                insight.source.rep_name = metadata.rep_name
+                insight.source.company_name = metadata.company_name
+                insight.id = self._generate_insight_id(insight.content, metadata.call_id)
+                if segment_index is not None:
+                    self._rematch_quote(insight, segment_index)
+        insights.call_ids = [metadata.call_id]
+        insights.processed_at = datetime.now()
+        return insights
+    
+    def _rematch_quote(self, insight: Insight, segment_index: _SegmentIndex):
+        """Re-resolve an insight's quote, speaker and timestamp against another transcript."""
+        matched_segment = None
+        if insight.direct_quote:
+            matched_segment = self._best_segment_for_quote(segment_index, insight.direct_quote)
+        
+        if matched_segment is None:
+            insight.direct_quote = None
+            insight.source.quote_snippet = None
+            insight.source.speaker_name = None
+            insight.source.timestamp = None
+        else:
+            insight.source.speaker_name = matched_segment.speaker_name
+            insight.source.timestamp = matched_segment.timestamp_display
+    
+    def _cached_result(
+        self,
+        insights: CallInsights,
+        transcript: Transcript,
+        start_time: float,
+        rematch_quotes: bool = False,
+    ) -> InsightExtractionResult:
+        """Wrap cached insights as an extraction result for this transcript."""
+        return InsightExtractionResult(
+            insights=self._rebind_to_transcript(insights, transcript, rematch_quotes),
+            processing_time_seconds=time.time() - start_time,
+        )
+    
     async def extract_from_transcript(self, transcript: Transcript) -> InsightExtractionResult:
-        """Extract insights from a single transcript using structured output."""
-        import time
+        """Extract insights from a single transcript, reusing cached results when possible."""
         start_time = time.time()
         
-        prompt = ChatPromptTemplate.from_template(self.EXTRACTION_PROMPT)
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = ResultCache.key_for(transcript.full_text, self.model_name)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return self._cached_result(cached, transcript, start_time)
         
-        # Chain with structured output - LLM returns Pydantic model directly
-        chain = prompt | self.llm
+        vector = None
+        if self.semantic_cache is not None:
+            try:
+                vector = await self.semantic_cache.embed(transcript.full_text)
+            except Exception as e:
+                print(f"⚠️  Semantic cache unavailable: {e}")
+            else:
+                cached = self.semantic_cache.lookup(vector)
+                if cached is not None:
+                    # A near-duplicate's quotes come from a different call
+                    return self._cached_result(cached, transcript, start_time, rematch_quotes=True)
+        
+        result = await self._extract_from_transcript(transcript)
+        
+        if cache_key is not None:
+            self.result_cache.put(cache_key, result.insights)
+        if vector is not None:
+            self.semantic_cache.store(vector, result.insights)
+        return result
+    
+    async def _extract_from_transcript(self, transcript: Transcript) -> InsightExtractionResult:
+        """Extract insights from a single transcript using structured output."""
+        start_time = time.time()
+        
+        # Call details are shared by the prompt and the tracing metadata
+        call_fields = {
+            "call_date": transcript.metadata.call_date_formatted,
+            "rep_name": transcript.metadata.rep_name,
+            "company_name": transcript.metadata.company_name or "Unknown",
+            "call_type": transcript.metadata.call_type or "Sales Call",
+        }
         
         # Create config with metadata for LangSmith tracing
         config = RunnableConfig(
-            metadata={
-                "call_id": transcript.metadata.call_id,
-                "rep_name": transcript.metadata.rep_name,
-                "company_name": transcript.metadata.company_name or "Unknown",
-                "call_date": transcript.metadata.call_date_formatted,
-                "call_type": transcript.metadata.call_type or "Sales Call",
-            },
-            tags=["insight-extraction", "transcript-analysis"],
+            metadata={"call_id": transcript.metadata.call_id, **call_fields},
+            tags=list(_EXTRACTION_TAGS),
         )
         
-        result = await chain.ainvoke(
+        # Tokenizing and quote matching are CPU-bound, so they run in a worker
+        # thread to keep other extractions (and web requests) moving
+        transcript_text = await asyncio.to_thread(self._truncate_transcript, transcript.full_text)
+        result = await self.extraction_chain.ainvoke(
             {
-                "call_date": transcript.metadata.call_date_formatted,
-                "rep_name": transcript.metadata.rep_name,
-                "company_name": transcript.metadata.company_name or "Unknown",
-                "call_type": transcript.metadata.call_type or "Sales Call",
-                "transcript_text": transcript.full_text[:15000],  # Limit for token constraints
+                **call_fields,
+                "transcript_text": transcript_text,
             },
             config=config,
         )
+        call_insights = await asyncio.to_thread(self._build_call_insights, result, transcript)
         
-        # Convert to CallInsights
-        call_insights = CallInsights(
+        processing_time = time.time() - start_time
+        
+        return InsightExtractionResult(
+            insights=call_insights,
+            processing_time_seconds=processing_time,
+        )
+    
+    def _build_call_insights(self, result: AllCategoryInsights, transcript: Transcript) -> CallInsights:
+        """Convert structured LLM output to CallInsights with source references."""
+        # Normalize segment text once for all categories. The Insight objects
+        # are already validated, so the category wrappers are built with
+        # model_construct to skip re-validating them.
+        segment_index = self._index_segments(transcript)
+        return CallInsights(
             call_ids=[transcript.metadata.call_id],
             processed_at=datetime.now(),
-            product_recommendations=ProductRecommendations(
+            product_recommendations=ProductRecommendations.model_construct(
                 insights=self._convert_to_insights(
-                    result.product_recommendations.insights, transcript
+                    result.product_recommendations.insights, transcript, segment_index
                 )
             ),
-            positive_feedback=PositiveFeedback(
+            positive_feedback=PositiveFeedback.model_construct(
                 insights=self._convert_to_insights(
-                    result.positive_feedback.insights, transcript
+                    result.positive_feedback.insights, transcript, segment_index
                 )
             ),
-            marketing_messaging=MarketingMessaging(
+            marketing_messaging=MarketingMessaging.model_construct(
                 insights=self._convert_to_insights(
-                    result.marketing_messaging.insights, transcript
+                    result.marketing_messaging.insights, transcript, segment_index
                 )
             ),
-            social_messaging=SocialMessaging(
+            social_messaging=SocialMessaging.model_construct(
                 insights=self._convert_to_insights(
-                    result.social_messaging.insights, transcript
+                    result.social_messaging.insights, transcript, segment_index
                 )
             ),
-            faq_ideas=FAQIdeas(
+            faq_ideas=FAQIdeas.model_construct(
                 insights=self._convert_to_insights(
-                    result.faq_ideas.insights, transcript
+                    result.faq_ideas.insights, transcript, segment_index
                 )
             ),
-            blog_topics=BlogTopics(
+            blog_topics=BlogTopics.model_construct(
                 insights=self._convert_to_insights(
-                    result.blog_topics.insights, transcript
+                    result.blog_topics.insights, transcript, segment_index
                 )
             ),
         )
-        
-        processing_time = time.time() - start_time
-        
-        return InsightExtractionResult(
-            insights=call_insights,
-            processing_time_seconds=processing_time,
-        )
     
     def extract_from_transcript_sync(self, transcript: Transcript) -> InsightExtractionResult:
         """Synchronous version of extract_from_transcript."""
-        import asyncio
         return asyncio.run(self.extract_from_transcript(transcript))
     
     async def extract_from_collection(
         self, 
         collection: TranscriptCollection,
         deduplicate: bool = True,
+        on_result: Optional[Callable[[CallInsights], None]] = None,
     ) -> InsightExtractionResult:
-        """Extract and merge insights from multiple transcripts."""
-        import time
+        """Extract and merge insights from multiple transcripts.
+        
+        If `on_result` is given it is called with each transcript's insights
+        as soon as that transcript finishes, before the merged result is ready.
+        """
         start_time = time.time()
         
         all_call_ids = []
@@ -359,8 +585,33 @@ Return a structured analysis of the top 5 most important/frequent themes.
         all_faq = []
         all_blog = []
         
-        for transcript in collection.transcripts:
-            result = await self.extract_from_transcript(transcript)
+        # Fan out LLM calls, bounded to stay under provider rate limits
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _extract_one(index: int, transcript: Transcript):
+            async with semaphore:
+                try:
+                    return index, await self.extract_from_transcript(transcript)
+                except Exception as e:
+                    return index, e
+        
+        results: list = [None] * len(collection.transcripts)
+        for next_done in asyncio.as_completed(
+            [_extract_one(i, t) for i, t in enumerate(collection.transcripts)]
+        ):
+            index, result = await next_done
+            results[index] = result
+            if on_result is not None and not isinstance(result, Exception):
+                on_result(result.insights)
+        
+        failures = [r for r in results if isinstance(r, Exception)]
+        if failures and len(failures) == len(results):
+            raise failures[0]
+        
+        for transcript, result in zip(collection.transcripts, results):
+            if isinstance(result, Exception):
+                print(f"⚠️  Extraction failed for call {transcript.metadata.call_id}: {result}")
+                continue
             insights = result.insights
             
             all_call_ids.extend(insights.call_ids)
@@ -373,7 +624,24 @@ Return a structured analysis of the top 5 most important/frequent themes.
         
         # Deduplicate if requested
         if deduplicate:
-            from ..utils.deduplication import deduplicate_insights
+            from ..utils.deduplication import deduplicate_by_id, deduplicate_insights
+            
+            # Cheap exact pass first so the pairwise passes see fewer candidates
+            all_product = deduplicate_by_id(all_product)
+            all_positive = deduplicate_by_id(all_positive)
+            all_marketing = deduplicate_by_id(all_marketing)
+            all_social = deduplicate_by_id(all_social)
+            all_faq = deduplicate_by_id(all_faq)
+            all_blog = deduplicate_by_id(all_blog)
+            
+            if self.semantic_dedup:
+                (
+                    all_product, all_positive, all_marketing,
+                    all_social, all_faq, all_blog,
+                ) = await self._prefilter_by_embedding([
+                    all_product, all_positive, all_marketing,
+                    all_social, all_faq, all_blog,
+                ])
             all_product = deduplicate_insights(all_product)
             all_positive = deduplicate_insights(all_positive)
             all_marketing = deduplicate_insights(all_marketing)
@@ -384,12 +652,12 @@ Return a structured analysis of the top 5 most important/frequent themes.
         merged_insights = CallInsights(
             call_ids=all_call_ids,
             processed_at=datetime.now(),
-            product_recommendations=ProductRecommendations(insights=all_product),
-            positive_feedback=PositiveFeedback(insights=all_positive),
-            marketing_messaging=MarketingMessaging(insights=all_marketing),
-            social_messaging=SocialMessaging(insights=all_social),
-            faq_ideas=FAQIdeas(insights=all_faq),
-            blog_topics=BlogTopics(insights=all_blog),
+            product_recommendations=ProductRecommendations.model_construct(insights=all_product),
+            positive_feedback=PositiveFeedback.model_construct(insights=all_positive),
+            marketing_messaging=MarketingMessaging.model_construct(insights=all_marketing),
+            social_messaging=SocialMessaging.model_construct(insights=all_social),
+            faq_ideas=FAQIdeas.model_construct(insights=all_faq),
+            blog_topics=BlogTopics.model_construct(insights=all_blog),
         )
         
         processing_time = time.time() - start_time
@@ -399,6 +667,29 @@ Return a structured analysis of the top 5 most important/frequent themes.
             processing_time_seconds=processing_time,
         )
     
+    async def _prefilter_by_embedding(self, groups: list[list[Insight]]) -> list[list[Insight]]:
+        """Drop paraphrased duplicates in each group using one batched embedding call."""
+        from ..utils.deduplication import deduplicate_by_embedding
+        
+        texts = [insight.content for group in groups for insight in group]
+        if not texts:
+            return groups
+        
+        try:
+            vectors = await self.embeddings.aembed_documents(texts)
+        except Exception as e:
+            print(f"⚠️  Embedding deduplication skipped: {e}")
+            return groups
+        
+        deduplicated = []
+        offset = 0
+        for group in groups:
+            deduplicated.append(
+                deduplicate_by_embedding(group, vectors[offset:offset + len(group)])
+            )
+            offset += len(group)
+        return deduplicated
+    
     async def generate_weekly_rollup(
         self,
         insights: CallInsights,
@@ -407,26 +698,12 @@ Return a structured analysis of the top 5 most important/frequent themes.
     ) -> WeeklyRollup:
         """Generate a weekly rollup with top themes."""
         
-        # Prepare insights summary for LLM
-        all_insights_text = []
-        for category_name in [
-            "product_recommendations", "positive_feedback", "marketing_messaging",
-            "social_messaging", "faq_ideas", "blog_topics"
-        ]:
-            category = getattr(insights, category_name)
-            for insight in category.insights:
-                all_insights_text.append(
-                    f"[{category_name}] {insight.content} (Call: {insight.source.call_id})"
-                )
-        
-        # Use LLM to identify themes with structured output
-        class ThemeAnalysis(BaseModel):
-            themes: list[ThemeSummary] = Field(description="Top 5 recurring themes")
-        
-        # Create a separate LLM instance with structured output for theme analysis
-        theme_llm = self.llm_base.with_structured_output(ThemeAnalysis)
-        prompt = ChatPromptTemplate.from_template(self.ROLLUP_PROMPT)
-        chain = prompt | theme_llm
+        # Prepare insights summary for LLM, formatting only the lines we send
+        insight_lines = (
+            f"[{category.value}] {insight.content} (Call: {insight.source.call_id})"
+            for category in InsightCategory
+            for insight in getattr(insights, category.value).insights
+        )
         
         # Config for theme analysis tracing
         config = RunnableConfig(
@@ -436,34 +713,33 @@ Return a structured analysis of the top 5 most important/frequent themes.
                 "week_start": week_start.isoformat(),
                 "week_end": week_end.isoformat(),
             },
-            tags=["weekly-rollup", "theme-analysis"],
+            tags=list(_ROLLUP_TAGS),
         )
         
-        result = await chain.ainvoke(
+        # Use LLM to identify themes with structured output
+        result = await self.rollup_chain.ainvoke(
             {
                 "num_calls": len(insights.call_ids),
-                "all_insights": "\n".join(all_insights_text[:100]),  # Limit
+                "all_insights": "\n".join(islice(insight_lines, 100)),  # Limit
             },
             config=config,
         )
         
+        # Count per category and collect reps from every category in one pass
+        insights_by_category = {}
+        reps = set()
+        for category, label in _ROLLUP_CATEGORY_LABELS.items():
+            category_insights = getattr(insights, category.value).insights
+            insights_by_category[label] = len(category_insights)
+            reps.update(insight.source.rep_name for insight in category_insights)
+        
         return WeeklyRollup(
             week_start=week_start,
             week_end=week_end,
             total_calls_processed=len(insights.call_ids),
             total_insights_extracted=insights.total_insights,
             top_themes=result.themes[:5],
-            insights_by_category={
-                "Product Recommendations": len(insights.product_recommendations.insights),
-                "Positive Feedback": len(insights.positive_feedback.insights),
-                "Marketing Messaging": len(insights.marketing_messaging.insights),
-                "Social Messaging": len(insights.social_messaging.insights),
-                "FAQ Ideas": len(insights.faq_ideas.insights),
-                "Blog Topics": len(insights.blog_topics.insights),
-            },
-            reps_analyzed=list(set(
-                insight.source.rep_name 
-                for insight in insights.product_recommendations.insights
-            )),
+            insights_by_category=insights_by_category,
+            reps_analyzed=sorted(reps),
         )
 
@@ -0,0 +1,48 @@
+"""Exact-match on-disk cache for insight extraction results."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+from ..models.insights import CallInsights
+
+
+class ResultCache:
+    """Store one extraction result per transcript, keyed by a SHA-256 of its text.
+
+    Rerunning the pipeline on unchanged transcripts then costs a file read
+    instead of an LLM call. Writes go through a temp file and `os.replace`
+    so a crash never leaves a truncated entry behind.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory).expanduser()
+
+    @staticmethod
+    def key_for(text: str, model_name: str) -> str:
+        """Build the cache key; the model is included since it changes the output."""
+        return hashlib.sha256(f"{model_name}\n{text}".encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CallInsights]:
+        """Return cached insights for a key, if present and readable."""
+        try:
+            return CallInsights.model_validate_json((self.directory / f"{key}.json").read_bytes())
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            return None  # Corrupt or outdated entry; treat as a miss
+
+    def put(self, key: str, insights: CallInsights):
+        """Atomically write insights for a key."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            # Bytes, so the file is UTF-8 (as get() reads it) whatever the locale
+            with os.fdopen(fd, "wb") as f:
+                f.write(insights.model_dump_json().encode())
+            os.replace(tmp_path, self.directory / f"{key}.json")
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
@@ -0,0 +1,102 @@
+"""Embedding-similarity cache for insight extraction results."""
+
+import math
+from pathlib import Path
+from typing import Optional, Union
+
+import orjson
+from langchain_core.embeddings import Embeddings
+
+from ..models.insights import CallInsights
+
+
+def _norm(vector: list[float]) -> float:
+    return math.sqrt(sum(x * x for x in vector))
+
+
+class SemanticCache:
+    """Reuse extraction results for transcripts that closely match earlier ones.
+
+    Entries are (embedding, insights) pairs appended to a JSONL file and held
+    in memory after the first lookup. Lookups are a linear cosine-similarity
+    scan, which is plenty for the few hundred calls a team reviews. Each
+    entry records the extraction model, and only entries from `model_name`
+    are served, matching how `ResultCache.key_for` includes the model.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        embeddings: Optional[Embeddings] = None,
+        threshold: float = 0.92,
+        max_chars: int = 8000,
+        model_name: Optional[str] = None,
+    ):
+        self.path = Path(path).expanduser()
+        self.embeddings = embeddings
+        self.threshold = threshold
+        self.max_chars = max_chars
+        self.model_name = model_name
+        self._entries: Optional[list[tuple[list[float], float, dict]]] = None
+
+    def _load_entries(self) -> list[tuple[list[float], float, dict]]:
+        """Read the index file once and keep it in memory."""
+        if self._entries is not None:
+            return self._entries
+
+        entries = []
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = orjson.loads(line)
+                        if record.get("model") != self.model_name:
+                            continue  # Extracted by a different model
+                        vector = record["embedding"]
+                        entries.append((vector, _norm(vector), record["insights"]))
+                    except (orjson.JSONDecodeError, KeyError):
+                        continue  # Skip partially written lines
+
+        self._entries = entries
+        return entries
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed the leading part of a transcript."""
+        if self.embeddings is None:
+            raise ValueError("No embeddings model configured for the semantic cache.")
+        return await self.embeddings.aembed_query(text[:self.max_chars])
+
+    def lookup(self, vector: list[float]) -> Optional[CallInsights]:
+        """Return cached insights for the most similar entry above the threshold."""
+        norm = _norm(vector)
+        if not norm:
+            return None
+
+        best_score = 0.0
+        best_payload = None
+        for cached_vector, cached_norm, payload in self._load_entries():
+            if not cached_norm or len(cached_vector) != len(vector):
+                continue
+            score = sum(a * b for a, b in zip(vector, cached_vector)) / (norm * cached_norm)
+            if score > best_score:
+                best_score = score
+                best_payload = payload
+
+        if best_payload is not None and best_score >= self.threshold:
+            return CallInsights.model_validate(best_payload)
+        return None
+
+    def store(self, vector: list[float], insights: CallInsights):
+        """Append an extraction result to the index."""
+        entries = self._load_entries()
+        payload = insights.model_dump(mode="json")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "ab") as f:
+            f.write(orjson.dumps({
+                "model": self.model_name,
+                "embedding": vector,
+                "insights": payload,
+            }) + b"\n")
+        entries.append((vector, _norm(vector), payload))
@@ -1,11 +1,14 @@
 """Chorus API integration for loading transcripts."""
 
+import asyncio
 import os
 from datetime import datetime, timedelta
 from typing import Optional
 import httpx
 import uuid
 
+from pydantic import BaseModel, ConfigDict, Field
+
 from ..models.transcript import (
     Transcript,
     TranscriptCollection,
@@ -15,21 +18,70 @@ from ..models.transcript import (
 )
 
 
+# Chorus speaker roles mapped to our speaker types; anything else is unknown
+SPEAKER_ROLES = {
+    "rep": Speaker.REP,
+    "sales": Speaker.REP,
+    "internal": Speaker.REP,
+    "prospect": Speaker.PROSPECT,
+    "customer": Speaker.PROSPECT,
+    "external": Speaker.PROSPECT,
+}
+
+
+class _ChorusCall(BaseModel):
+    """Fields read from a Chorus call record."""
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+    
+    id: str = Field(default_factory=lambda: str(uuid.uuid4())[:8])
+    date: datetime = Field(default_factory=datetime.now)
+    rep_name: str = "Unknown Rep"
+    rep_email: Optional[str] = None
+    prospect_name: Optional[str] = None
+    company_name: Optional[str] = None
+    duration_seconds: Optional[int] = None
+    call_type: Optional[str] = None
+    deal_stage: Optional[str] = None
+
+
+class _ChorusUtterance(BaseModel):
+    """Fields read from a Chorus transcript utterance."""
+    speaker_role: Optional[str] = ""
+    speaker_name: Optional[str] = None
+    text: str = ""
+    start_time: Optional[float] = None
+    end_time: Optional[float] = None
+
+
+class _ChorusTranscript(BaseModel):
+    """Fields read from a Chorus transcript response."""
+    utterances: list[_ChorusUtterance] = Field(default_factory=list)
+
+
 class ChorusAPILoader:
     """Load transcripts from Chorus API.
     
     Note: This is a template implementation. Actual Chorus API
     endpoints and authentication may differ. Update as needed
     based on Chorus API documentation.
+    
+    One HTTP client is shared by every request so connections are kept
+    alive between calls. Use the loader as an async context manager (or
+    call `aclose`) to release them:
+    
+        async with ChorusAPILoader() as loader:
+            collection = await loader.load_recent(days=7)
     """
     
     def __init__(
         self,
         api_key: Optional[str] = None,
         api_url: Optional[str] = None,
+        max_concurrency: int = 16,
     ):
         self.api_key = api_key or os.getenv("CHORUS_API_KEY")
         self.api_url = api_url or os.getenv("CHORUS_API_URL", "https://api.chorus.ai/v1")
+        self.max_concurrency = max(1, max_concurrency)
         
         if not self.api_key:
             raise ValueError(
@@ -41,18 +93,29 @@ class ChorusAPILoader:
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        
+        self._client = httpx.AsyncClient(
+            base_url=self.api_url.rstrip("/") + "/",
+            headers=self.headers,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the pooled HTTP connections."""
+        await self._client.aclose()
     
     async def _fetch(self, endpoint: str, params: Optional[dict] = None) -> dict:
         """Make an authenticated request to Chorus API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.api_url}/{endpoint}",
-                headers=self.headers,
-                params=params,
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._client.get(endpoint, params=params)
+        response.raise_for_status()
+        return response.json()
     
     async def get_calls(
         self,
@@ -82,39 +145,32 @@ class ChorusAPILoader:
     
     def _parse_chorus_call(self, call_data: dict, transcript_data: dict) -> Transcript:
         """Parse Chorus API response into Transcript model."""
+        # Validate both payloads up front, then read plain attributes
+        call = _ChorusCall.model_validate(call_data)
+        chorus_transcript = _ChorusTranscript.model_validate(transcript_data)
+        
         # Parse metadata
         metadata = CallMetadata(
-            call_id=call_data.get("id", str(uuid.uuid4())[:8]),
-            call_date=datetime.fromisoformat(
-                call_data.get("date", datetime.now().isoformat())
-            ),
-            rep_name=call_data.get("rep_name", "Unknown Rep"),
-            rep_email=call_data.get("rep_email"),
-            prospect_name=call_data.get("prospect_name"),
-            company_name=call_data.get("company_name"),
-            call_duration_seconds=call_data.get("duration_seconds"),
-            call_type=call_data.get("call_type"),
-            deal_stage=call_data.get("deal_stage"),
+            call_id=call.id,
+            call_date=call.date,
+            rep_name=call.rep_name,
+            rep_email=call.rep_email,
+            prospect_name=call.prospect_name,
+            company_name=call.company_name,
+            call_duration_seconds=call.duration_seconds,
+            call_type=call.call_type,
+            deal_stage=call.deal_stage,
         )
         
         # Parse segments
         segments = []
-        for utterance in transcript_data.get("utterances", []):
-            # Determine speaker type
-            speaker_role = utterance.get("speaker_role", "").lower()
-            if speaker_role in ["rep", "sales", "internal"]:
-                speaker = Speaker.REP
-            elif speaker_role in ["prospect", "customer", "external"]:
-                speaker = Speaker.PROSPECT
-            else:
-                speaker = Speaker.UNKNOWN
-            
+        for utterance in chorus_transcript.utterances:
             segments.append(TranscriptSegment(
-                speaker=speaker,
-                speaker_name=utterance.get("speaker_name"),
-                text=utterance.get("text", ""),
-                start_time=utterance.get("start_time"),
-                end_time=utterance.get("end_time"),
+                speaker=SPEAKER_ROLES.get((utterance.speaker_role or "").lower(), Speaker.UNKNOWN),
+                speaker_name=utterance.speaker_name,
+                text=utterance.text,
+                start_time=utterance.start_time,
+                end_time=utterance.end_time,
             ))
         
         return Transcript(
@@ -122,6 +178,27 @@ class ChorusAPILoader:
             segments=segments,
         )
     
+    async def _load_transcripts(self, calls: list[dict]) -> list[Transcript]:
+        """Fetch and parse transcripts for calls concurrently, skipping failures."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        errors: list[str] = []
+        
+        async def _fetch_one(call: dict) -> Optional[Transcript]:
+            async with semaphore:
+                try:
+                    transcript_data = await self.get_transcript(call["id"])
+                    return self._parse_chorus_call(call, transcript_data)
+                except Exception as e:
+                    errors.append(f"Error loading transcript for call {call.get('id')}: {e}")
+                    return None
+        
+        results = await asyncio.gather(*[_fetch_one(call) for call in calls])
+        
+        # Report failures in one write rather than interleaving them mid-fetch
+        if errors:
+            print("\n".join(errors))
+        return [t for t in results if t is not None]
+    
     async def load_recent(self, days: int = 7, limit: int = 50) -> TranscriptCollection:
         """Load transcripts from recent days."""
         end_date = datetime.now()
@@ -133,14 +210,7 @@ class ChorusAPILoader:
             limit=limit,
         )
         
-        transcripts = []
-        for call in calls:
-            try:
-                transcript_data = await self.get_transcript(call["id"])
-                transcript = self._parse_chorus_call(call, transcript_data)
-                transcripts.append(transcript)
-            except Exception as e:
-                print(f"Error loading transcript for call {call.get('id')}: {e}")
+        transcripts = await self._load_transcripts(calls)
         
         return TranscriptCollection(
             transcripts=transcripts,
@@ -159,14 +229,7 @@ class ChorusAPILoader:
             rep_email=rep_email,
         )
         
-        transcripts = []
-        for call in calls:
-            try:
-                transcript_data = await self.get_transcript(call["id"])
-                transcript = self._parse_chorus_call(call, transcript_data)
-                transcripts.append(transcript)
-            except Exception as e:
-                print(f"Error loading transcript for call {call.get('id')}: {e}")
+        transcripts = await self._load_transcripts(calls)
         
         return TranscriptCollection(
             transcripts=transcripts,
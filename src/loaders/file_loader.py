@@ -1,13 +1,19 @@
 """File-based transcript loader for JSON/text/PDF files."""
 
-import json
+import functools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Optional, Union
 import uuid
 import io
+import mmap
 import re
 
+import orjson
+
 from ..models.transcript import (
     Transcript,
     TranscriptCollection,
@@ -16,6 +22,63 @@ from ..models.transcript import (
     Speaker,
 )
 
+# JSON speaker values to enum members, built once instead of per segment
+_SPEAKER_BY_VALUE = {speaker.value: speaker for speaker in Speaker}
+
+# Header and line patterns for plain-text/PDF transcripts, compiled once
+_MEETING_RE = re.compile(r"(?im)^\s*Meeting:\s*(.+?)\s*$")
+_PARTICIPANTS_RE = re.compile(r"(?im)^participants\s*:\s*$")
+_TRANSCRIPT_RE = re.compile(r"(?im)^transcript\s*$")
+_PARTICIPANT_LINE_RE = re.compile(
+    r"^\s*[-•]\s*(?P<name>.+?)(?:\s*\((?P<role>.+?)\))?\s*-\s*(?P<email>\S+@\S+)\s*$"
+)
+_TIMESTAMP_RE = re.compile(r"^\s*(?P<h>\d{2}):(?P<m>\d{2}):(?P<s>\d{2})(?:\s+(?P<speaker>.+?))?\s*$")
+_SECTION_RE = re.compile(r"(?im)^(meeting transcript|participants\s*:|transcript)$")
+# First characters a section header can start with; lets most lines skip the regex
+_SECTION_INITIALS = frozenset("mMpPtT")
+# Substring tests for "Name:" labels in plain-text transcripts ("Sales Rep", "Customer")
+_REP_LABEL_RE = re.compile(r"rep|sales|ae")
+_PROSPECT_LABEL_RE = re.compile(r"prospect|customer|client|buyer")
+
+# pypdf copies a whole file into memory when given a path; map larger files instead
+_PDF_MMAP_MIN_BYTES = 1024 * 1024
+
+# Rep names that mean "not provided" (form defaults and common filler)
+_PLACEHOLDER_REP_NAMES = frozenset({"unknown rep", "unknown", "n/a", "na", "none", "meeting", "call"})
+
+
+def _is_placeholder_rep(name: Optional[str]) -> bool:
+    """Check whether a rep name is missing or a placeholder."""
+    if not name:
+        return True
+    n = name.strip().lower()
+    if n in _PLACEHOLDER_REP_NAMES:
+        return True
+    # People often type "Meeting" / "Sales Call" etc.
+    return "meeting" in n and len(n.split()) <= 2
+
+
+@functools.cache
+def _pdf_backend() -> tuple[Any, Any]:
+    """Resolve the PDF library once: (pymupdf, None) or (None, PdfReader).
+    
+    A failed import isn't cached in sys.modules, so without this every PDF
+    would search the import path again for a missing pymupdf.
+    """
+    try:
+        import pymupdf
+        return pymupdf, None
+    except ImportError:
+        pass
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ImportError(
+            "pymupdf or pypdf is required for PDF support. "
+            "Install one with: pip install pypdf"
+        )
+    return None, PdfReader
+
 
 def extract_text_from_pdf(file_path_or_bytes: Union[Path, bytes]) -> str:
     """Extract text content from a PDF file.
@@ -26,25 +89,42 @@ def extract_text_from_pdf(file_path_or_bytes: Union[Path, bytes]) -> str:
     Returns:
         Extracted text from all pages
     """
-    try:
-        from pypdf import PdfReader
-    except ImportError:
-        raise ImportError(
-            "pypdf is required for PDF support. Install it with: pip install pypdf"
-        )
+    pymupdf, PdfReader = _pdf_backend()
     
-    if isinstance(file_path_or_bytes, bytes):
-        reader = PdfReader(io.BytesIO(file_path_or_bytes))
+    if pymupdf is not None:
+        # PyMuPDF's C core extracts text far faster than pure-Python pypdf
+        if isinstance(file_path_or_bytes, bytes):
+            doc = pymupdf.open(stream=file_path_or_bytes, filetype="pdf")
+        else:
+            doc = pymupdf.open(str(file_path_or_bytes))
+        with doc:
+            text_parts = [page.get_text("text") for page in doc]
     else:
-        reader = PdfReader(file_path_or_bytes)
+        if isinstance(file_path_or_bytes, bytes):
+            reader = PdfReader(io.BytesIO(file_path_or_bytes))
+            text_parts = [page.extract_text() for page in reader.pages]
+        elif os.path.getsize(file_path_or_bytes) >= _PDF_MMAP_MIN_BYTES:
+            # Let pypdf read straight from the page cache
+            with open(file_path_or_bytes, "rb") as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                reader = PdfReader(mapped)
+                text_parts = [page.extract_text() for page in reader.pages]
+        else:
+            reader = PdfReader(file_path_or_bytes)
+            text_parts = [page.extract_text() for page in reader.pages]
     
-    text_parts = []
-    for page in reader.pages:
-        page_text = page.extract_text()
-        if page_text:
-            text_parts.append(page_text)
+    return "\n\n".join(part for part in text_parts if part)
+
+
+def _load_file_safely(path: Path) -> tuple[Optional[Transcript], Optional[str]]:
+    """Load one transcript, returning the error message instead of raising.
     
-    return "\n\n".join(text_parts)
+    Module-level so it can be pickled into worker processes.
+    """
+    try:
+        return FileLoader().load_single_file(path), None
+    except Exception as e:
+        return None, str(e)
 
 
 class FileLoader:
@@ -52,8 +132,19 @@ class FileLoader:
     
     SUPPORTED_EXTENSIONS = {".json", ".txt", ".pdf"}
     
-    def __init__(self, data_dir: str = "data/sample_transcripts"):
+    # Below this many files, worker process startup costs more than it saves.
+    # A spawned worker re-imports run.py (typer, rich, langchain) in ~0.4s,
+    # while threads parse a transcript in ~3ms, so 8 cores break even near
+    # 140 files.
+    PROCESS_POOL_MIN_FILES = 256
+    
+    def __init__(self, data_dir: str = "data/sample_transcripts", workers: Optional[int] = None):
         self.data_dir = Path(data_dir)
+        # PDF and text parsing dominate load time, so fan files out across workers
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        # Last load_all() result, reused while the directory listing is unchanged
+        self._cached_signature: Optional[tuple] = None
+        self._cached_collection: Optional[TranscriptCollection] = None
     
     def load_single_file(
         self,
@@ -90,14 +181,14 @@ class FileLoader:
     
     def load_json_transcript(self, file_path: Path) -> Transcript:
         """Load a transcript from a JSON file."""
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        data = orjson.loads(Path(file_path).read_bytes())
         
         # Parse metadata
         metadata_data = data.get("metadata", {})
+        raw_date = metadata_data.get("call_date")
         metadata = CallMetadata(
             call_id=metadata_data.get("call_id", str(uuid.uuid4())[:8]),
-            call_date=datetime.fromisoformat(metadata_data.get("call_date", datetime.now().isoformat())),
+            call_date=datetime.fromisoformat(raw_date) if raw_date else datetime.now(),
             rep_name=metadata_data.get("rep_name", "Unknown Rep"),
             rep_email=metadata_data.get("rep_email"),
             prospect_name=metadata_data.get("prospect_name"),
@@ -107,26 +198,24 @@ class FileLoader:
             deal_stage=metadata_data.get("deal_stage"),
         )
         
-        # Parse segments
+        # Parse segments as plain dicts; validating them in the single
+        # Transcript.model_validate call below beats one constructor per segment
         segments = []
         for seg_data in data.get("segments", []):
             speaker_val = seg_data.get("speaker", "unknown").lower()
-            speaker = Speaker(speaker_val) if speaker_val in [s.value for s in Speaker] else Speaker.UNKNOWN
-            
-            segment = TranscriptSegment(
-                speaker=speaker,
-                speaker_name=seg_data.get("speaker_name"),
-                text=seg_data.get("text", ""),
-                start_time=seg_data.get("start_time"),
-                end_time=seg_data.get("end_time"),
-            )
-            segments.append(segment)
+            segments.append({
+                "speaker": _SPEAKER_BY_VALUE.get(speaker_val, Speaker.UNKNOWN),
+                "speaker_name": seg_data.get("speaker_name"),
+                "text": seg_data.get("text", ""),
+                "start_time": seg_data.get("start_time"),
+                "end_time": seg_data.get("end_time"),
+            })
         
-        return Transcript(
-            metadata=metadata,
-            segments=segments,
-            raw_text=data.get("raw_text"),
-        )
+        return Transcript.model_validate({
+            "metadata": metadata,
+            "segments": segments,
+            "raw_text": data.get("raw_text"),
+        })
     
     def load_text_transcript(
         self, 
@@ -136,8 +225,12 @@ class FileLoader:
         company_name: Optional[str] = None,
     ) -> Transcript:
         """Load a transcript from a plain text file."""
-        with open(file_path, "r") as f:
-            raw_text = f.read()
+        # One read + decode skips TextIOWrapper's incremental decoding. Strict,
+        # so a mis-encoded file is reported instead of loaded as U+FFFD
+        raw_text = file_path.read_bytes().decode("utf-8")
+        if "\r" in raw_text:
+            # Keep text-mode newline handling for Windows/old-Mac exports
+            raw_text = raw_text.replace("\r\n", "\n").replace("\r", "\n")
         
         return self._create_transcript_from_text(
             raw_text=raw_text,
@@ -153,8 +246,13 @@ class FileLoader:
         rep_name: str = "Unknown Rep",
         call_date: Optional[datetime] = None,
         company_name: Optional[str] = None,
+        source_file: Optional[str] = None,
     ) -> Transcript:
-        """Load a transcript from a PDF file."""
+        """Load a transcript from a PDF file.
+        
+        ``source_file`` names the call for uploads saved under a temp name;
+        it defaults to the file's own name.
+        """
         raw_text = extract_text_from_pdf(file_path)
         
         return self._create_transcript_from_text(
@@ -162,7 +260,7 @@ class FileLoader:
             rep_name=rep_name,
             call_date=call_date,
             company_name=company_name,
-            source_file=file_path.name,
+            source_file=source_file or file_path.name,
         )
     
     def load_from_text(
@@ -212,22 +310,13 @@ class FileLoader:
         # Generate call_id from filename or random
         call_id = source_file.replace(".", "_")[:20] if source_file else str(uuid.uuid4())[:8]
 
-        def _is_placeholder_rep(name: Optional[str]) -> bool:
-            if not name:
-                return True
-            n = name.strip().lower()
-            if n in {"unknown rep", "unknown", "n/a", "na", "none", "meeting", "call"}:
-                return True
-            # People often type "Meeting" / "Sales Call" etc.
-            if "meeting" in n and len(n.split()) <= 2:
-                return True
-            return False
-
-        rep_name_input = rep_name
-        rep_name_for_parsing = "Unknown Rep" if _is_placeholder_rep(rep_name_input) else rep_name_input
+        rep_is_placeholder = _is_placeholder_rep(rep_name)
+        rep_name_for_parsing = "Unknown Rep" if rep_is_placeholder else rep_name
 
         # First, try to parse speaker labels from text
-        segments = self._parse_text_segments(raw_text, rep_name_for_parsing)
+        # Split once; segment parsing and participant lookup both walk the lines
+        lines = raw_text.splitlines()
+        segments = self._parse_text_segments(raw_text, rep_name_for_parsing, lines=lines)
 
         inferred_company_name = company_name
         if not inferred_company_name:
@@ -235,14 +324,14 @@ class FileLoader:
 
         # If rep_name wasn't provided, try to infer it from the conversation
         inferred_rep_name = rep_name_for_parsing
-        if _is_placeholder_rep(rep_name_input):
+        if rep_is_placeholder:
             # Prefer a segment explicitly marked as REP
             rep_segments = [s for s in segments if s.speaker == Speaker.REP and s.speaker_name]
             if rep_segments:
                 inferred_rep_name = rep_segments[0].speaker_name
             else:
                 # Try to infer from participant list (PDF-like transcripts)
-                inferred_from_participants = self._infer_rep_from_participants(raw_text)
+                inferred_from_participants = self._infer_rep_from_participants(raw_text, lines=lines)
                 if inferred_from_participants:
                     inferred_rep_name = inferred_from_participants
                 else:
@@ -253,8 +342,9 @@ class FileLoader:
 
         # If we inferred a rep name, mark matching segments as REP for downstream use.
         if inferred_rep_name and segments:
+            inferred_rep_key = inferred_rep_name.strip().lower()
             for seg in segments:
-                if seg.speaker_name and seg.speaker_name.strip().lower() == inferred_rep_name.strip().lower():
+                if seg.speaker_name and seg.speaker_name.strip().lower() == inferred_rep_key:
                     seg.speaker = Speaker.REP
 
         metadata = CallMetadata(
@@ -273,7 +363,7 @@ class FileLoader:
     def _infer_company_from_text(self, text: str) -> Optional[str]:
         """Best-effort company inference from common transcript headers."""
         # Example from sample PDFs: "Meeting: CloudShield Inc - Security Platform Demo"
-        m = re.search(r"(?im)^\s*Meeting:\s*(.+?)\s*$", text)
+        m = _MEETING_RE.search(text)
         if not m:
             return None
         meeting_line = m.group(1).strip()
@@ -282,7 +372,9 @@ class FileLoader:
             return meeting_line.split(" - ", 1)[0].strip() or None
         return meeting_line or None
 
-    def _infer_rep_from_participants(self, text: str) -> Optional[str]:
+    def _infer_rep_from_participants(
+        self, text: str, lines: Optional[list[str]] = None
+    ) -> Optional[str]:
         """Best-effort rep inference from a Participants section (common in Meet/Teams exports)."""
         # We prefer internal participants with role hints.
         role_keywords = (
@@ -295,20 +387,20 @@ class FileLoader:
             "product manager",
         )
         in_participants = False
-        for raw_line in text.splitlines():
+        for raw_line in text.splitlines() if lines is None else lines:
             line = raw_line.strip()
             if not line:
                 continue
-            if re.match(r"(?im)^participants\s*:\s*$", line):
+            if _PARTICIPANTS_RE.match(line):
                 in_participants = True
                 continue
-            if in_participants and re.match(r"(?im)^transcript\s*$", line):
+            if in_participants and _TRANSCRIPT_RE.match(line):
                 break
             if not in_participants:
                 continue
 
             # Example: "- Rachel Martinez (Account Executive) - rachel.martinez@ourcompany.com"
-            m = re.match(r"^\s*[-•]\s*(?P<name>.+?)(?:\s*\((?P<role>.+?)\))?\s*-\s*(?P<email>\S+@\S+)\s*$", line)
+            m = _PARTICIPANT_LINE_RE.match(line)
             if not m:
                 continue
             name = (m.group("name") or "").strip()
@@ -322,72 +414,78 @@ class FileLoader:
                     return name
         return None
     
-    def _parse_text_segments(self, text: str, rep_name: str) -> list[TranscriptSegment]:
-        """Attempt to parse speaker-labeled text into segments."""
+    def _parse_text_segments(
+        self, text: str, rep_name: str, lines: Optional[list[str]] = None
+    ) -> list[TranscriptSegment]:
+        """Attempt to parse speaker-labeled text into segments.
+        
+        Pass `lines` when the caller has already split `text`.
+        """
         segments: list[TranscriptSegment] = []
-        lines = [ln.rstrip() for ln in text.strip().split("\n")]
+        if lines is None:
+            lines = text.splitlines()  # Each loop strips the lines it reads
+        rep_name_lower = rep_name.lower() if rep_name else ""
+        # Only a real rep name can mark timestamped speakers as the rep
+        match_rep = bool(rep_name_lower) and rep_name != "Unknown Rep"
 
-        # First: try to parse Meet/Teams style timestamps + speaker blocks (common in PDFs)
-        timestamp_re = re.compile(r"^\s*(?P<h>\d{2}):(?P<m>\d{2}):(?P<s>\d{2})(?:\s+(?P<speaker>.+?))?\s*$")
+        # First: try to parse Meet/Teams style timestamps + speaker blocks (common in PDFs).
+        # One forward pass: each timestamp line opens a block, and the lines
+        # after it are its speaker (if not on the timestamp line) and message.
+        block: Optional[tuple[int, str]] = None  # (seconds, timestamp_str)
+        speaker_name: Optional[str] = None
+        message_lines: list[str] = []
+        awaiting_speaker = False
+
+        def close_block():
+            message = " ".join(message_lines).strip()
+            if block is None or not message or not speaker_name:
+                return
+            speaker = Speaker.UNKNOWN
+            if match_rep and speaker_name.lower() == rep_name_lower:
+                speaker = Speaker.REP
+            segments.append(
+                TranscriptSegment(
+                    speaker=speaker,
+                    speaker_name=speaker_name,
+                    text=message,
+                    start_time=float(block[0]),
+                    timestamp_str=block[1],
+                )
+            )
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        for raw_line in lines:
+            line = raw_line.strip()
             if not line:
-                i += 1
                 continue
 
-            m = timestamp_re.match(line)
-            if not m:
-                break  # Not a timestamped transcript
+            # Sometimes timestamp is on its own line; speaker follows.
+            if awaiting_speaker:
+                speaker_name = line
+                awaiting_speaker = False
+                continue
 
-            hh = int(m.group("h"))
-            mm = int(m.group("m"))
-            ss = int(m.group("s"))
-            seconds = hh * 3600 + mm * 60 + ss
-            timestamp_str = f"{hh:02d}:{mm:02d}:{ss:02d}"
+            # Lines are stripped, so a timestamp line must start with a digit
+            m = _TIMESTAMP_RE.match(line) if line[0].isdigit() else None
+            if m:
+                close_block()
+                hh = int(m.group("h"))
+                mm = int(m.group("m"))
+                ss = int(m.group("s"))
+                block = (hh * 3600 + mm * 60 + ss, f"{hh:02d}:{mm:02d}:{ss:02d}")
+                speaker_name = (m.group("speaker") or "").strip() or None
+                awaiting_speaker = speaker_name is None
+                message_lines = []
+                continue
 
-            speaker_name = (m.group("speaker") or "").strip() or None
-            # Sometimes timestamp is on its own line; speaker follows.
-            if speaker_name is None:
-                j = i + 1
-                while j < len(lines) and not lines[j].strip():
-                    j += 1
-                if j < len(lines):
-                    speaker_name = lines[j].strip()
-                    i = j  # advance to speaker line
-
-            # Collect message lines until next timestamp
-            message_lines: list[str] = []
-            i += 1
-            while i < len(lines):
-                next_line = lines[i].strip()
-                if not next_line:
-                    i += 1
-                    continue
-                if timestamp_re.match(next_line):
-                    break
-                # Skip obvious section headers sometimes present in exports
-                if re.match(r"(?im)^(meeting transcript|participants\s*:|transcript)$", next_line):
-                    i += 1
-                    continue
-                message_lines.append(next_line)
-                i += 1
+            if block is None:
+                break  # Not a timestamped transcript
 
-            message = " ".join(message_lines).strip()
-            if message and speaker_name:
-                speaker = Speaker.UNKNOWN
-                if rep_name and rep_name != "Unknown Rep" and speaker_name.lower() == rep_name.lower():
-                    speaker = Speaker.REP
-                segments.append(
-                    TranscriptSegment(
-                        speaker=speaker,
-                        speaker_name=speaker_name,
-                        text=message,
-                        start_time=float(seconds),
-                        timestamp_str=timestamp_str,
-                    )
-                )
+            # Skip obvious section headers sometimes present in exports
+            if line[0] in _SECTION_INITIALS and _SECTION_RE.match(line):
+                continue
+            message_lines.append(line)
+
+        close_block()
 
         if segments:
             return segments
@@ -410,11 +508,11 @@ class FileLoader:
                 potential_label = potential_label.strip().lower()
                 
                 # Check for common speaker indicators
-                if any(word in potential_label for word in ["rep", "sales", "ae", rep_name.lower()]):
+                if _REP_LABEL_RE.search(potential_label) or rep_name_lower in potential_label:
                     speaker = Speaker.REP
                     speaker_name = potential_label.title()
                     content = rest.strip()
-                elif any(word in potential_label for word in ["prospect", "customer", "client", "buyer"]):
+                elif _PROSPECT_LABEL_RE.search(potential_label):
                     speaker = Speaker.PROSPECT
                     speaker_name = potential_label.title()
                     content = rest.strip()
@@ -433,51 +531,75 @@ class FileLoader:
     
     def load_all(self) -> TranscriptCollection:
         """Load all transcripts from the data directory (JSON, TXT, PDF)."""
-        transcripts = []
-        
         if not self.data_dir.exists():
             return TranscriptCollection(transcripts=[])
         
-        # Load JSON files
-        for json_file in self.data_dir.glob("*.json"):
-            try:
-                transcript = self.load_json_transcript(json_file)
-                transcripts.append(transcript)
-            except Exception as e:
-                print(f"Error loading {json_file}: {e}")
+        # One directory scan (scandir reuses dirent type info instead of stat-ing)
+        by_extension: dict[str, list[Path]] = {".json": [], ".txt": [], ".pdf": []}
+        signature = []
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in by_extension and entry.is_file():
+                    by_extension[ext].append(Path(entry.path))
+                    stat = entry.stat()
+                    signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        paths = [*by_extension[".json"], *by_extension[".txt"], *by_extension[".pdf"]]
         
-        # Load text files
-        for txt_file in self.data_dir.glob("*.txt"):
-            try:
-                transcript = self.load_text_transcript(txt_file)
-                transcripts.append(transcript)
-            except Exception as e:
-                print(f"Error loading {txt_file}: {e}")
+        # Nothing added, removed, or modified since the last call: skip parsing
+        signature = tuple(sorted(signature))
+        if signature == self._cached_signature and self._cached_collection is not None:
+            return self._copy_collection(self._cached_collection)
         
-        # Load PDF files
-        for pdf_file in self.data_dir.glob("*.pdf"):
-            try:
-                transcript = self.load_pdf_transcript(pdf_file)
-                transcripts.append(transcript)
-            except Exception as e:
-                print(f"Error loading {pdf_file}: {e}")
+        # Parse files in parallel; a single bad file shouldn't stop the batch.
+        # Parsing is CPU-bound Python, so large batches use processes to get
+        # past the GIL. Spawned (not forked) workers stay safe when the caller
+        # has other threads running, such as the live dashboard server.
+        use_processes = (
+            self.workers > 1
+            and (os.cpu_count() or 1) > 1
+            and len(paths) >= self.PROCESS_POOL_MIN_FILES
+        )
+        if use_processes:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = list(executor.map(_load_file_safely, paths, chunksize=4))
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(_load_file_safely, paths))
+        
+        transcripts = []
+        for path, (transcript, error) in zip(paths, results):
+            if error is not None:
+                print(f"Error loading {path}: {error}")
+                continue
+            transcripts.append(transcript)
         
         # Sort by date
         transcripts.sort(key=lambda t: t.metadata.call_date, reverse=True)
         
-        # Set date range
+        # Set date range (newest first after the sort above)
         date_start = None
         date_end = None
         if transcripts:
-            dates = [t.metadata.call_date for t in transcripts]
-            date_start = min(dates)
-            date_end = max(dates)
+            date_start = transcripts[-1].metadata.call_date
+            date_end = transcripts[0].metadata.call_date
         
-        return TranscriptCollection(
+        collection = TranscriptCollection(
             transcripts=transcripts,
             date_range_start=date_start,
             date_range_end=date_end,
         )
+        self._cached_signature = signature
+        self._cached_collection = collection
+        return self._copy_collection(collection)
+    
+    @staticmethod
+    def _copy_collection(collection: TranscriptCollection) -> TranscriptCollection:
+        """Give callers their own transcript list so the cached one stays intact."""
+        return collection.model_copy(update={"transcripts": list(collection.transcripts)})
     
     def load_by_date_range(
         self, 
@@ -44,7 +44,7 @@ class SourceReference(BaseModel):
     
     def format_reference(self) -> str:
         """Format source reference for display."""
-        parts = [f"Call: {self.call_date.strftime('%Y-%m-%d')}"]
+        parts = [f"Call: {self.call_date.date().isoformat()}"]
         if self.speaker_name:
             parts.append(f"Speaker: {self.speaker_name}")
         parts.append(f"Rep: {self.rep_name}")
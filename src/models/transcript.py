@@ -1,8 +1,9 @@
 """Pydantic models for transcript data structures."""
 
 from datetime import datetime
+from functools import cached_property
 from enum import Enum
-from typing import Optional
+from typing import ClassVar, Optional
 from pydantic import BaseModel, Field
 
 
@@ -46,8 +47,7 @@ class TranscriptSegment(BaseModel):
         """Format timestamp for display (MM:SS by default)."""
         if self.start_time is None:
             return None
-        minutes = int(self.start_time // 60)
-        seconds = int(self.start_time % 60)
+        minutes, seconds = divmod(int(self.start_time), 60)
         return f"{minutes:02d}:{seconds:02d}"
 
     @property
@@ -96,15 +96,14 @@ class CallMetadata(BaseModel):
     @property
     def call_date_formatted(self) -> str:
         """Format call date for display."""
-        return self.call_date.strftime("%Y-%m-%d")
+        return self.call_date.date().isoformat()
     
     @property
     def duration_formatted(self) -> Optional[str]:
         """Format duration for display."""
         if self.call_duration_seconds is None:
             return None
-        minutes = self.call_duration_seconds // 60
-        seconds = self.call_duration_seconds % 60
+        minutes, seconds = divmod(self.call_duration_seconds, 60)
         return f"{minutes}m {seconds}s"
 
 
@@ -123,9 +122,33 @@ class Transcript(BaseModel):
         description="Raw transcript text if segments not available"
     )
     
-    @property
+    # Cached properties derived from segments/raw_text
+    _TEXT_CACHE: ClassVar[tuple[str, ...]] = ("full_text", "word_count")
+    
+    def _reset_text_cache(self) -> None:
+        for name in self._TEXT_CACHE:
+            self.__dict__.pop(name, None)
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in ("segments", "raw_text"):
+            self._reset_text_cache()
+    
+    def model_copy(self, *, update=None, deep: bool = False) -> "Transcript":
+        copy = super().model_copy(update=update, deep=deep)
+        if update and ("segments" in update or "raw_text" in update):
+            copy._reset_text_cache()
+        return copy
+    
+    @cached_property
     def full_text(self) -> str:
-        """Get the complete transcript as text."""
+        """Get the complete transcript as text.
+        
+        Built once per instance: the extractor reads it for the cache key,
+        the embedding, and the prompt. Reassigning segments or raw_text
+        (or model_copy with either updated) rebuilds it; mutating the
+        segment list in place does not.
+        """
         if self.raw_text:
             return self.raw_text
         
@@ -138,7 +161,7 @@ class Transcript(BaseModel):
         
         return "\n".join(lines)
     
-    @property
+    @cached_property
     def word_count(self) -> int:
         """Count total words in transcript."""
         return len(self.full_text.split())
@@ -167,13 +190,13 @@ class TranscriptCollection(BaseModel):
     
     @property
     def reps(self) -> list[str]:
-        """Unique rep names in collection."""
-        return list(set(t.metadata.rep_name for t in self.transcripts))
+        """Unique rep names in collection, in first-seen order."""
+        return list(dict.fromkeys(t.metadata.rep_name for t in self.transcripts))
     
     @property
     def companies(self) -> list[str]:
-        """Unique company names in collection."""
-        return list(set(
+        """Unique company names in collection, in first-seen order."""
+        return list(dict.fromkeys(
             t.metadata.company_name 
             for t in self.transcripts 
             if t.metadata.company_name
@@ -1,6 +1,8 @@
 """Google Docs output handler for insights delivery (OAuth-only)."""
 
 import os
+import random
+import time
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
@@ -15,6 +17,39 @@ from ..models.insights import CallInsights, WeeklyRollup, Insight
 from ..config import get_settings
 
 
+# Report dividers
+_DIVIDER = "─" * 50 + "\n\n"
+_APPEND_RULE = "=" * 50
+
+_CONFIDENCE_LABELS = {"high": "High", "medium": "Medium", "low": "Low"}
+
+# (heading, CallInsights field) per section, in report order
+_REPORT_SECTIONS = (
+    ("🚀  PRODUCT RECOMMENDATIONS", "product_recommendations"),
+    ("⭐  POSITIVE FEEDBACK & TESTIMONIALS", "positive_feedback"),
+    ("📣  MARKETING & BRAND MESSAGING", "marketing_messaging"),
+    ("📱  SOCIAL MESSAGING IDEAS", "social_messaging"),
+    ("❓  FAQ IDEAS", "faq_ideas"),
+    ("📝  BLOG TOPICS & CONTENT IDEAS", "blog_topics"),
+)
+_APPEND_SECTIONS = (
+    ("🚀 Product Recommendations", "product_recommendations"),
+    ("⭐ Positive Feedback", "positive_feedback"),
+    ("📣 Marketing Messaging", "marketing_messaging"),
+    ("📱 Social Messaging", "social_messaging"),
+    ("❓ FAQ Ideas", "faq_ideas"),
+    ("📝 Blog Topics", "blog_topics"),
+)
+_MOCK_SECTIONS = (
+    ("🚀 Product Recommendations", "product_recommendations"),
+    ("⭐ Positive Feedback & Testimonials", "positive_feedback"),
+    ("📣 Marketing & Brand Messaging", "marketing_messaging"),
+    ("📱 Social Messaging Ideas", "social_messaging"),
+    ("❓ FAQ Ideas", "faq_ideas"),
+    ("📝 Blog Topics & Content Ideas", "blog_topics"),
+)
+
+
 class GoogleDocsOutput:
     """Create and update Google Docs with extracted insights using OAuth 2.0."""
     
@@ -23,6 +58,11 @@ class GoogleDocsOutput:
         'https://www.googleapis.com/auth/drive',  # Full Drive access (more permissive)
     ]
     
+    # Retries for rate limits (429) and transient 5xx errors on idempotent
+    # reads; the client library backs off exponentially with jitter between
+    # attempts. Writes only retry 429s (see _execute_write).
+    API_RETRIES = 5
+    
     def __init__(
         self,
         folder_id: Optional[str] = None,
@@ -74,7 +114,7 @@ class GoogleDocsOutput:
             # Try to get user email
             if self.drive_service:
                 try:
-                    about = self.drive_service.about().get(fields="user").execute()
+                    about = self.drive_service.about().get(fields="user").execute(num_retries=self.API_RETRIES)
                     self._user_email = about.get("user", {}).get("emailAddress")
                 except Exception:
                     pass
@@ -142,6 +182,21 @@ To set up OAuth authentication:
         
         return credentials
     
+    def _execute_write(self, request):
+        """Execute a non-idempotent request, retrying only rate-limit rejections.
+        
+        A 429 means the request was refused, so sending it again is safe. A
+        5xx may arrive after the server already applied it, and a retry could
+        create a second document or insert the text twice, so those raise.
+        """
+        for attempt in range(self.API_RETRIES + 1):
+            try:
+                return request.execute()
+            except HttpError as e:
+                if e.resp.status != 429 or attempt == self.API_RETRIES:
+                    raise
+                time.sleep(min(2 ** attempt, 32) + random.random())
+    
     def create_document(self, title: str) -> str:
         """Create a new Google Doc and return its ID.
         
@@ -150,87 +205,70 @@ To set up OAuth authentication:
         if not self.docs_service:
             raise ValueError("Google Docs not authenticated. Check credentials.")
         
-        # Create the document
-        doc = self.docs_service.documents().create(body={'title': title}).execute()
-        doc_id = doc.get('documentId')
-        
-        # Move to specified folder if provided
+        # Create straight into the folder: one Drive call instead of
+        # create + get parents + move
         if self.folder_id and self.drive_service:
             try:
-                # Get current parents to remove them
-                file = self.drive_service.files().get(
-                    fileId=doc_id, 
-                    fields='parents'
-                ).execute()
-                previous_parents = ",".join(file.get('parents', []))
-                
-                # Move the file to the new folder
-                self.drive_service.files().update(
-                    fileId=doc_id,
-                    addParents=self.folder_id,
-                    removeParents=previous_parents,
-                    fields='id, parents'
-                ).execute()
-                print(f"✅ Document moved to folder: {self.folder_id}")
+                file = self._execute_write(self.drive_service.files().create(
+                    body={
+                        'name': title,
+                        'mimeType': 'application/vnd.google-apps.document',
+                        'parents': [self.folder_id],
+                    },
+                    fields='id',
+                ))
+                print(f"✅ Document created in folder: {self.folder_id}")
+                return file['id']
             except HttpError as e:
-                print(f"⚠️  Could not move doc to folder: {e}")
-                print(f"   The document was created in your Drive root instead.")
+                # Only a missing or unshared folder is safe to fall back from;
+                # after a 5xx the doc may already exist in the folder
+                if e.resp.status not in (403, 404):
+                    raise
+                print(f"⚠️  Could not create doc in folder: {e}")
+                print(f"   The document will be created in your Drive root instead.")
         else:
             print("ℹ️  No folder ID specified. Document created in Drive root.")
             print("   Set GOOGLE_DOC_FOLDER_ID in .env to specify a destination folder.")
         
+        doc = self._execute_write(self.docs_service.documents().create(body={'title': title}))
+        doc_id = doc.get('documentId')
+        
         return doc_id
     
     def _format_insight_bullet(self, insight: Insight) -> str:
         """Format a single insight as a readable bullet point with clean spacing."""
-        confidence_labels = {
-            "high": "High",
-            "medium": "Medium",
-            "low": "Low",
-        }
-
-        conf_value = insight.confidence.value if hasattr(insight.confidence, "value") else insight.confidence
-        conf_label = confidence_labels.get(str(conf_value).lower(), "Medium")
-
-        lines = []
-        # Main line
-        lines.append(f"• {insight.content}")
+        conf_value = getattr(insight.confidence, "value", insight.confidence)
+        conf_label = _CONFIDENCE_LABELS.get(str(conf_value).lower(), "Medium")
 
-        # Optional direct quote
-        if insight.direct_quote:
-            lines.append(f'    "{insight.direct_quote}"')
+        # Optional direct quote under the main line
+        quote = f'\n    "{insight.direct_quote}"' if insight.direct_quote else ""
 
-        # Source and confidence
-        lines.append(f"    Source: {insight.source.format_reference()}")
-        lines.append(f"    Confidence: {conf_label}")
-
-        return "\n".join(lines)
+        return (
+            f"• {insight.content}{quote}\n"
+            f"    Source: {insight.source.format_reference()}\n"
+            f"    Confidence: {conf_label}"
+        )
     
-    def _build_document_requests(self, insights: CallInsights, weekly_rollup: Optional[WeeklyRollup] = None) -> list:
-        """Build batch update requests for the document with clean, readable formatting."""
-        requests = []
-        current_index = 1  # Start after initial empty position
+    def _build_document_requests(
+        self,
+        insights: CallInsights,
+        weekly_rollup: Optional[WeeklyRollup] = None,
+        generated_at: Optional[datetime] = None,
+    ) -> list:
+        """Build batch update requests for the document with clean, readable formatting.
+        
+        The whole report is inserted as one block of text, so there are no
+        per-section document indexes to keep in sync.
+        """
+        parts = []
         
         # Document title
         date_str = insights.processed_at.strftime('%B %d, %Y')  # e.g., "December 19, 2024"
         title = f"Meeting Insights Report\n{date_str}\n\n"
-        requests.append({
-            'insertText': {
-                'location': {'index': current_index},
-                'text': title
-            }
-        })
-        current_index += len(title)
+        parts.append(title)
         
         # Horizontal divider
-        divider = "─" * 50 + "\n\n"
-        requests.append({
-            'insertText': {
-                'location': {'index': current_index},
-                'text': divider
-            }
-        })
-        current_index += len(divider)
+        parts.append(_DIVIDER)
         
         # Summary section with clean formatting
         summary = f"""SUMMARY
@@ -241,87 +279,56 @@ To set up OAuth authentication:
 
 
 """
-        requests.append({
-            'insertText': {
-                'location': {'index': current_index},
-                'text': summary
-            }
-        })
-        current_index += len(summary)
+        parts.append(summary)
         
         # Weekly rollup if provided
         if weekly_rollup and weekly_rollup.top_themes:
-            rollup_text = "─" * 50 + "\n\n"
-            rollup_text += "TOP THEMES THIS WEEK\n\n"
+            parts.append(_DIVIDER)
+            parts.append("TOP THEMES THIS WEEK\n\n")
             
             for i, theme in enumerate(weekly_rollup.top_themes[:5], 1):
-                rollup_text += f"    {i}. {theme.theme}\n"
-                rollup_text += f"       Appeared {theme.occurrence_count} times\n\n"
+                parts.append(f"    {i}. {theme.theme}\n")
+                parts.append(f"       Appeared {theme.occurrence_count} times\n\n")
                 
                 if theme.example_insights:
-                    rollup_text += "       Examples:\n"
+                    parts.append("       Examples:\n")
                     for example in theme.example_insights[:2]:
-                        rollup_text += f"       • {example}\n"
-                    rollup_text += "\n"
+                        parts.append(f"       • {example}\n")
+                    parts.append("\n")
             
-            rollup_text += "\n"
-            requests.append({
-                'insertText': {
-                    'location': {'index': current_index},
-                    'text': rollup_text
-                }
-            })
-            current_index += len(rollup_text)
+            parts.append("\n")
         
         # Category sections with improved formatting
-        categories = [
-            ("PRODUCT RECOMMENDATIONS", "🚀", insights.product_recommendations),
-            ("POSITIVE FEEDBACK & TESTIMONIALS", "⭐", insights.positive_feedback),
-            ("MARKETING & BRAND MESSAGING", "📣", insights.marketing_messaging),
-            ("SOCIAL MESSAGING IDEAS", "📱", insights.social_messaging),
-            ("FAQ IDEAS", "❓", insights.faq_ideas),
-            ("BLOG TOPICS & CONTENT IDEAS", "📝", insights.blog_topics),
-        ]
-
-        for category_title, emoji, category in categories:
+        for heading, field in _REPORT_SECTIONS:
+            category = getattr(insights, field)
             # Section header with divider
-            section_text = "─" * 50 + "\n\n"
-            section_text += f"{emoji}  {category_title}\n\n"
+            parts.append(_DIVIDER)
+            parts.append(f"{heading}\n\n")
 
             # Category description
             if getattr(category, "description", None):
-                section_text += f"{category.description}\n\n"
+                parts.append(f"{category.description}\n\n")
 
             if category.insights:
                 for insight in category.insights:
-                    section_text += self._format_insight_bullet(insight) + "\n\n\n"
+                    parts.append(self._format_insight_bullet(insight))
+                    parts.append("\n\n\n")
             else:
-                section_text += "No insights extracted for this category.\n\n"
-
-            section_text += "\n"
+                parts.append("No insights extracted for this category.\n\n")
 
-            requests.append(
-                {
-                    "insertText": {
-                        "location": {"index": current_index},
-                        "text": section_text,
-                    }
-                }
-            )
-            current_index += len(section_text)
+            parts.append("\n")
         
         # Footer
-        footer = "\n" + "─" * 50 + "\n\n"
-        footer += "Generated by Meeting Insights\n"
-        footer += f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        requests.append({
+        parts.append("\n" + _DIVIDER)
+        parts.append("Generated by Meeting Insights\n")
+        parts.append(f"{(generated_at or datetime.now()).strftime('%Y-%m-%d %H:%M:%S')}\n")
+        
+        return [{
             'insertText': {
-                'location': {'index': current_index},
-                'text': footer
+                'location': {'index': 1},  # Start after initial empty position
+                'text': "".join(parts),
             }
-        })
-        
-        return requests
+        }]
     
     def write_insights(
         self, 
@@ -344,19 +351,22 @@ To set up OAuth authentication:
         if not self.docs_service:
             raise ValueError("Google Docs not authenticated. Check credentials.")
         
+        # One timestamp for the title and footer
+        now = datetime.now()
+        
         # Create new doc if no ID provided
         if not doc_id:
-            date_str = datetime.now().strftime('%B %d, %Y')  # e.g., "December 19, 2024"
+            date_str = now.strftime('%B %d, %Y')  # e.g., "December 19, 2024"
             doc_title = title or f"Meeting Insights - {date_str}"
             doc_id = self.create_document(doc_title)
         
         # Build and execute requests
-        requests = self._build_document_requests(insights, weekly_rollup)
+        requests = self._build_document_requests(insights, weekly_rollup, generated_at=now)
         
-        self.docs_service.documents().batchUpdate(
+        self._execute_write(self.docs_service.documents().batchUpdate(
             documentId=doc_id,
             body={'requests': requests}
-        ).execute()
+        ))
         
         return doc_id
     
@@ -369,40 +379,30 @@ To set up OAuth authentication:
         if not self.docs_service:
             raise ValueError("Google Docs not authenticated. Check credentials.")
         
-        # Get current document length
-        doc = self.docs_service.documents().get(documentId=doc_id).execute()
-        end_index = doc.get('body', {}).get('content', [{}])[-1].get('endIndex', 1) - 1
-        
         # Build append text
-        append_text = f"\n\n{'='*50}\n📥 Additional Insights - {datetime.now().strftime('%Y-%m-%d %H:%M')}\n{'='*50}\n\n"
-        
-        categories = [
-            ("🚀 Product Recommendations", insights.product_recommendations),
-            ("⭐ Positive Feedback", insights.positive_feedback),
-            ("📣 Marketing Messaging", insights.marketing_messaging),
-            ("📱 Social Messaging", insights.social_messaging),
-            ("❓ FAQ Ideas", insights.faq_ideas),
-            ("📝 Blog Topics", insights.blog_topics),
-        ]
-        
-        for category_title, category in categories:
+        parts = [f"\n\n{_APPEND_RULE}\n📥 Additional Insights - {datetime.now().strftime('%Y-%m-%d %H:%M')}\n{_APPEND_RULE}\n\n"]
+        
+        for category_title, field in _APPEND_SECTIONS:
+            category = getattr(insights, field)
             if category.insights:
-                append_text += f"\n{category_title}\n"
+                parts.append(f"\n{category_title}\n")
                 for insight in category.insights:
-                    append_text += self._format_insight_bullet(insight) + "\n"
+                    parts.append(self._format_insight_bullet(insight))
+                    parts.append("\n")
         
         # Append to document
-        self.docs_service.documents().batchUpdate(
+        self._execute_write(self.docs_service.documents().batchUpdate(
             documentId=doc_id,
             body={
                 'requests': [{
                     'insertText': {
-                        'location': {'index': end_index},
-                        'text': append_text
+                        # Let Docs find the end of the body; saves a documents.get round trip
+                        'endOfSegmentLocation': {'segmentId': ''},
+                        'text': "".join(parts)
                     }
                 }]
             }
-        ).execute()
+        ))
 
 
 class MockGoogleDocsOutput:
@@ -431,63 +431,56 @@ class MockGoogleDocsOutput:
         weekly_rollup: Optional[WeeklyRollup] = None,
     ) -> str:
         """Write insights to mock document."""
+        now = datetime.now()
         if not doc_id:
-            date_str = datetime.now().strftime('%B %d, %Y')
+            date_str = now.strftime('%B %d, %Y')
             doc_title = title or f"Meeting Insights - {date_str}"
             doc_id = self.create_document(doc_title)
         
         # Build content string with clean formatting
-        content = f"# {self.documents[doc_id]['title']}\n\n"
-        content += "---\n\n"
-        content += "## Summary\n\n"
-        content += f"- **Calls Analyzed:** {len(insights.call_ids)}\n"
-        content += f"- **Total Insights:** {insights.total_insights}\n"
-        content += f"- **Generated:** {datetime.now().strftime('%Y-%m-%d at %H:%M')}\n\n"
+        parts = [f"# {self.documents[doc_id]['title']}\n\n"]
+        parts.append("---\n\n")
+        parts.append("## Summary\n\n")
+        parts.append(f"- **Calls Analyzed:** {len(insights.call_ids)}\n")
+        parts.append(f"- **Total Insights:** {insights.total_insights}\n")
+        parts.append(f"- **Generated:** {now.strftime('%Y-%m-%d at %H:%M')}\n\n")
         
         if weekly_rollup and weekly_rollup.top_themes:
-            content += "---\n\n"
-            content += "## 🔥 Top Themes This Week\n\n"
+            parts.append("---\n\n")
+            parts.append("## 🔥 Top Themes This Week\n\n")
             for i, theme in enumerate(weekly_rollup.top_themes[:5], 1):
-                content += f"{i}. **{theme.theme}** (appeared {theme.occurrence_count} times)\n"
+                parts.append(f"{i}. **{theme.theme}** (appeared {theme.occurrence_count} times)\n")
                 if theme.example_insights:
                     for example in theme.example_insights[:2]:
-                        content += f"   - {example}\n"
-                content += "\n"
-        
-        categories = [
-            ("🚀 Product Recommendations", insights.product_recommendations),
-            ("⭐ Positive Feedback & Testimonials", insights.positive_feedback),
-            ("📣 Marketing & Brand Messaging", insights.marketing_messaging),
-            ("📱 Social Messaging Ideas", insights.social_messaging),
-            ("❓ FAQ Ideas", insights.faq_ideas),
-            ("📝 Blog Topics & Content Ideas", insights.blog_topics),
-        ]
-        
-        for cat_title, category in categories:
-            content += "---\n\n"
-            content += f"## {cat_title}\n\n"
+                        parts.append(f"   - {example}\n")
+                parts.append("\n")
+        
+        for cat_title, field in _MOCK_SECTIONS:
+            category = getattr(insights, field)
+            parts.append("---\n\n")
+            parts.append(f"## {cat_title}\n\n")
             
             if category.description:
-                content += f"*{category.description}*\n\n"
+                parts.append(f"*{category.description}*\n\n")
             
             if category.insights:
                 for idx, insight in enumerate(category.insights, 1):
-                    content += f"### {idx}. {insight.content}\n\n"
+                    parts.append(f"### {idx}. {insight.content}\n\n")
                     
                     if insight.direct_quote:
-                        content += f'> 💬 "{insight.direct_quote}"\n\n'
+                        parts.append(f'> 💬 "{insight.direct_quote}"\n\n')
                     
-                    content += f"📍 **Source:** {insight.source.format_reference()}\n\n"
+                    parts.append(f"📍 **Source:** {insight.source.format_reference()}\n\n")
                     
                     conf_value = insight.confidence.value if hasattr(insight.confidence, 'value') else insight.confidence
-                    content += f"**Confidence:** {conf_value.capitalize()}\n\n"
+                    parts.append(f"**Confidence:** {conf_value.capitalize()}\n\n")
             else:
-                content += "*No insights extracted for this category.*\n\n"
+                parts.append("*No insights extracted for this category.*\n\n")
         
-        content += "---\n\n"
-        content += f"*Generated by Meeting Insights • {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+        parts.append("---\n\n")
+        parts.append(f"*Generated by Meeting Insights • {now.strftime('%Y-%m-%d %H:%M:%S')}*\n")
         
-        self.documents[doc_id]["content"] = content
+        self.documents[doc_id]["content"] = "".join(parts)
         return doc_id
     
     def get_document_url(self, doc_id: str) -> str:
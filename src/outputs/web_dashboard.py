@@ -2,19 +2,39 @@
 
 import os
 import asyncio
+import hashlib
+import shutil
+import tempfile
+import threading
+from collections import deque
 from datetime import datetime
 from typing import Optional
 from pathlib import Path
 
 from fastapi import FastAPI, Request, Query, UploadFile, File, Form, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
+import orjson
 
 from ..models.insights import CallInsights, WeeklyRollup, InsightCategory
 from ..models.transcript import TranscriptCollection
 
 
+# Short names accepted by /api/filter's category parameter
+_FILTER_CATEGORIES = {
+    "product": InsightCategory.PRODUCT_RECOMMENDATIONS,
+    "feedback": InsightCategory.POSITIVE_FEEDBACK,
+    "marketing": InsightCategory.MARKETING_MESSAGING,
+    "social": InsightCategory.SOCIAL_MESSAGING,
+    "faq": InsightCategory.FAQ_IDEAS,
+    "blog": InsightCategory.BLOG_TOPICS,
+}
+# Categories whose API entries also carry the supporting quote
+_QUOTED_API_CATEGORIES = frozenset({InsightCategory.POSITIVE_FEEDBACK, InsightCategory.SOCIAL_MESSAGING})
+
+
 class WebDashboard:
     """Web dashboard state manager."""
     
@@ -22,39 +42,148 @@ class WebDashboard:
         self.current_insights: Optional[CallInsights] = None
         self.weekly_rollup: Optional[WeeklyRollup] = None
         self.last_updated: Optional[datetime] = None
-        # History of individual runs/uploads (not aggregated)
-        self.history: list[CallInsights] = []
+        # History of individual runs/uploads (not aggregated); the oldest
+        # entries drop off automatically once it is full
+        self.history: deque[CallInsights] = deque(maxlen=20)
+        # Bumped on every change so open pages know when to refresh
+        self.revision = 0
+        # Session navigation metadata, rebuilt when the revision changes
+        self._sessions: list[dict] = []
+        self._sessions_revision: Optional[int] = None
+        # Serialized /api/insights body and its ETag, tagged with its revision
+        self._insights_payload: Optional[tuple[int, str, bytes]] = None
+        # Serializes pipeline-thread writes with request-side snapshots, so a
+        # cached body is always tagged with the revision it was built from
+        self._lock = threading.RLock()
+    
+    def update(
+        self,
+        insights: CallInsights,
+        rollup: Optional[WeeklyRollup] = None,
+        record_history: bool = True,
+    ):
+        """Update dashboard with new insights.
+        
+        Pass ``record_history=False`` for an early preview of a run that
+        will be recorded by a later update, so it isn't listed twice.
+        """
+        with self._lock:
+            self.current_insights = insights
+            self.weekly_rollup = rollup
+            self.last_updated = datetime.now()
+            if record_history:
+                self.history.append(insights)
+                # Pipeline runs keep only the last 10
+                while len(self.history) > 10:
+                    self.history.popleft()
+            self.revision += 1
+    
+    def merge(self, insights: CallInsights):
+        """Merge insights into the aggregated view without replacing it."""
+        # One timestamp for both processed_at and last_updated
+        now = datetime.now()
+        with self._lock:
+            if self.current_insights:
+                self.current_insights = _merge_call_insights(self.current_insights, insights, now)
+            else:
+                # Copy so later merges don't mutate the caller's object
+                self.current_insights = insights.model_copy(deep=True)
+            self.last_updated = now
+            self.revision += 1
+    
+    def add_session(self, insights: CallInsights) -> int:
+        """Record one upload as its own session and merge it into the aggregate.
+        
+        Returns:
+            Index of the new session in history
+        """
+        with self._lock:
+            self.history.append(insights)
+            self.merge(insights)
+            return len(self.history) - 1
+    
+    def sessions_metadata(self) -> list[dict]:
+        """Navigation entries for each session in history.
+        
+        Every history change bumps the revision, as do merges that can
+        change a session's counts, so the list is reused until then.
+        """
+        with self._lock:
+            revision = self.revision
+            if self._sessions_revision != revision:
+                self._sessions = [
+                    {
+                        "index": idx,
+                        "label": f"Session {idx + 1}",
+                        "calls": len(ci.call_ids),
+                        "total_insights": ci.total_insights,
+                        "processed_at": ci.processed_at,
+                    }
+                    for idx, ci in enumerate(self.history)
+                ]
+                self._sessions_revision = revision
+            return self._sessions
     
-    def update(self, insights: CallInsights, rollup: Optional[WeeklyRollup] = None):
-        """Update dashboard with new insights."""
-        self.current_insights = insights
-        self.weekly_rollup = rollup
-        self.last_updated = datetime.now()
-        self.history.append(insights)
-        # Keep last 10 runs
-        if len(self.history) > 10:
-            self.history = self.history[-10:]
+    def insights_payload(self) -> tuple[str, bytes]:
+        """ETag and JSON body for the insights API, rebuilt when the revision changes."""
+        with self._lock:
+            revision = self.revision
+            if self._insights_payload is None or self._insights_payload[0] != revision:
+                insights = self.current_insights
+                categories = {}
+                for cat in InsightCategory:
+                    with_quote = cat in _QUOTED_API_CATEGORIES
+                    items = []
+                    for i in insights.get_category(cat).insights:
+                        item = {"content": i.content, "confidence": i.confidence, "source": i.source.format_reference()}
+                        if with_quote:
+                            item["quote"] = i.direct_quote
+                        items.append(item)
+                    categories[cat.value] = items
+                body = orjson.dumps(
+                    {
+                        "status": "ok",
+                        "last_updated": self.last_updated,
+                        "total_calls": len(insights.call_ids),
+                        "total_insights": insights.total_insights,
+                        "categories": categories,
+                    },
+                    option=orjson.OPT_NON_STR_KEYS,
+                )
+                etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+                self._insights_payload = (revision, etag, body)
+            return self._insights_payload[1], self._insights_payload[2]
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+    
+    Defined here because FastAPI's own ORJSONResponse is deprecated.
+    """
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
 
 
 # Global dashboard instance
 dashboard = WebDashboard()
 
 
-def _merge_call_insights(base: CallInsights, new: CallInsights) -> CallInsights:
+def _merge_call_insights(
+    base: CallInsights, new: CallInsights, now: Optional[datetime] = None
+) -> CallInsights:
     """Merge insights from a new run into an existing CallInsights object."""
-    # Extend call IDs
-    merged_call_ids = list({*base.call_ids, *new.call_ids})
-
-    def _merge_category(cat_name: InsightCategory):
-        base_cat = base.get_category(cat_name)
-        new_cat = new.get_category(cat_name)
-        base_cat.insights.extend(new_cat.insights)
+    # Extend call IDs in place and in arrival order, skipping ones already merged
+    seen = set(base.call_ids)
+    for call_id in new.call_ids:
+        if call_id not in seen:
+            seen.add(call_id)
+            base.call_ids.append(call_id)
 
     for cat in InsightCategory:
-        _merge_category(cat)
+        base.get_category(cat).insights += new.get_category(cat).insights
 
-    base.call_ids = merged_call_ids
-    base.processed_at = datetime.now()
+    base.processed_at = now or datetime.now()
     return base
 
 
@@ -65,11 +194,38 @@ def create_app() -> FastAPI:
         title="Meet Insights Dashboard",
         description="Chorus call transcript insights visualization",
         version="1.0.0",
+        # orjson encodes the API payloads (and datetimes) in native code
+        default_response_class=ORJSONResponse,
     )
     
+    # Set when the server is stopping so open event streams end and
+    # uvicorn's graceful shutdown isn't held up by idle browser tabs
+    app.state.shutdown = threading.Event()
+    
     # Setup templates
     templates_dir = Path(__file__).parent.parent.parent / "web" / "templates"
     templates = Jinja2Templates(directory=str(templates_dir))
+    # Templates ship with the app: skip Jinja's per-request mtime check and
+    # compile the dashboard once here instead of on the first page view
+    templates.env.auto_reload = False
+    templates.get_template("dashboard.html")
+    
+    # Loaded here rather than at module level so importing src.outputs stays light
+    from ..loaders.file_loader import FileLoader
+    from ..extractors.insight_extractor import InsightExtractor
+    from ..config import get_settings
+    
+    # Shared by every analyze request. The extractor (and its OpenAI client
+    # connection pool) is built on first use, so the dashboard still starts
+    # without an API key configured.
+    loader = FileLoader()
+    extractor: Optional[InsightExtractor] = None
+    
+    def get_extractor() -> InsightExtractor:
+        nonlocal extractor
+        if extractor is None:
+            extractor = InsightExtractor(model_name=get_settings().openai_model)
+        return extractor
     
     # Setup static files
     static_dir = Path(__file__).parent.parent.parent / "web" / "static"
@@ -79,28 +235,16 @@ def create_app() -> FastAPI:
     @app.get("/", response_class=HTMLResponse)
     async def home(request: Request):
         """Main dashboard page (aggregated insights)."""
-        # Build session list metadata for navigation
-        sessions = []
-        for idx, ci in enumerate(dashboard.history):
-            sessions.append(
-                {
-                    "index": idx,
-                    "label": f"Session {idx + 1}",
-                    "calls": len(ci.call_ids),
-                    "total_insights": ci.total_insights,
-                    "processed_at": ci.processed_at,
-                }
-            )
-
         return templates.TemplateResponse(
+            request,
             "dashboard.html",
             {
-                "request": request,
                 "insights": dashboard.current_insights,
                 "rollup": dashboard.weekly_rollup,
                 "last_updated": dashboard.last_updated,
                 "session_index": None,
-                "sessions": sessions,
+                "sessions": dashboard.sessions_metadata(),
+                "revision": dashboard.revision,
             }
         )
 
@@ -112,70 +256,30 @@ def create_app() -> FastAPI:
 
         insights = dashboard.history[index]
 
-        # Build session list metadata for navigation
-        sessions = []
-        for idx, ci in enumerate(dashboard.history):
-            sessions.append(
-                {
-                    "index": idx,
-                    "label": f"Session {idx + 1}",
-                    "calls": len(ci.call_ids),
-                    "total_insights": ci.total_insights,
-                    "processed_at": ci.processed_at,
-                }
-            )
-
         return templates.TemplateResponse(
+            request,
             "dashboard.html",
             {
-                "request": request,
                 "insights": insights,
                 "rollup": None,
                 "last_updated": dashboard.last_updated,
                 "session_index": index,
-                "sessions": sessions,
+                "sessions": dashboard.sessions_metadata(),
             }
         )
     
     @app.get("/api/insights")
-    async def get_insights():
+    async def get_insights(request: Request):
         """API endpoint for insights data."""
         if not dashboard.current_insights:
             return {"status": "no_data", "message": "No insights available. Run the pipeline first."}
         
-        insights = dashboard.current_insights
-        return {
-            "status": "ok",
-            "last_updated": dashboard.last_updated.isoformat() if dashboard.last_updated else None,
-            "total_calls": len(insights.call_ids),
-            "total_insights": insights.total_insights,
-            "categories": {
-                "product_recommendations": [
-                    {"content": i.content, "confidence": i.confidence, "source": i.source.format_reference()}
-                    for i in insights.product_recommendations.insights
-                ],
-                "positive_feedback": [
-                    {"content": i.content, "confidence": i.confidence, "source": i.source.format_reference(), "quote": i.direct_quote}
-                    for i in insights.positive_feedback.insights
-                ],
-                "marketing_messaging": [
-                    {"content": i.content, "confidence": i.confidence, "source": i.source.format_reference()}
-                    for i in insights.marketing_messaging.insights
-                ],
-                "social_messaging": [
-                    {"content": i.content, "confidence": i.confidence, "source": i.source.format_reference(), "quote": i.direct_quote}
-                    for i in insights.social_messaging.insights
-                ],
-                "faq_ideas": [
-                    {"content": i.content, "confidence": i.confidence, "source": i.source.format_reference()}
-                    for i in insights.faq_ideas.insights
-                ],
-                "blog_topics": [
-                    {"content": i.content, "confidence": i.confidence, "source": i.source.format_reference()}
-                    for i in insights.blog_topics.insights
-                ],
-            }
-        }
+        # Polling clients send back the ETag and get a 304 until something changes
+        etag, body = dashboard.insights_payload()
+        headers = {"ETag": etag}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
     
     @app.get("/api/rollup")
     async def get_rollup():
@@ -186,8 +290,8 @@ def create_app() -> FastAPI:
         rollup = dashboard.weekly_rollup
         return {
             "status": "ok",
-            "week_start": rollup.week_start.isoformat(),
-            "week_end": rollup.week_end.isoformat(),
+            "week_start": rollup.week_start,
+            "week_end": rollup.week_end,
             "total_calls": rollup.total_calls_processed,
             "total_insights": rollup.total_insights_extracted,
             "top_themes": [
@@ -216,29 +320,29 @@ def create_app() -> FastAPI:
         insights = dashboard.current_insights
         result = {}
         
-        category_map = {
-            "product": insights.product_recommendations,
-            "feedback": insights.positive_feedback,
-            "marketing": insights.marketing_messaging,
-            "social": insights.social_messaging,
-            "faq": insights.faq_ideas,
-            "blog": insights.blog_topics,
-        }
+        if category:
+            selected = [category] if category in _FILTER_CATEGORIES else []
+        else:
+            selected = list(_FILTER_CATEGORIES)
         
-        for cat_name, cat_data in category_map.items():
-            if category and cat_name != category:
-                continue
-            
+        rep_query = rep.lower() if rep else None
+        # Most insights share a handful of reps, so match each name once
+        rep_matches: dict[str, bool] = {}
+        
+        for cat_name in selected:
             filtered = []
-            for insight in cat_data.insights:
+            for insight in insights.get_category(_FILTER_CATEGORIES[cat_name]).insights:
                 # Filter by rep
-                if rep and rep.lower() not in insight.source.rep_name.lower():
-                    continue
-                # Filter by date
-                if date:
-                    insight_date = insight.source.call_date.strftime("%Y-%m-%d")
-                    if insight_date != date:
+                if rep_query:
+                    rep_name = insight.source.rep_name
+                    matched = rep_matches.get(rep_name)
+                    if matched is None:
+                        matched = rep_matches[rep_name] = rep_query in rep_name.lower()
+                    if not matched:
                         continue
+                # Filter by date
+                if date and insight.source.call_date.date().isoformat() != date:
+                    continue
                 
                 filtered.append({
                     "content": insight.content,
@@ -251,13 +355,28 @@ def create_app() -> FastAPI:
         
         return {"status": "ok", "results": result}
     
+    @app.get("/api/events")
+    async def events(request: Request):
+        """Server-sent events announcing each new dashboard revision."""
+        shutdown = request.app.state.shutdown
+        
+        async def stream():
+            last_sent = None
+            while not shutdown.is_set() and not await request.is_disconnected():
+                if dashboard.revision != last_sent:
+                    last_sent = dashboard.revision
+                    yield f"data: {last_sent}\n\n"
+                await asyncio.sleep(1.0)
+        
+        return StreamingResponse(stream(), media_type="text/event-stream")
+    
     @app.get("/health")
     async def health():
         """Health check endpoint."""
         return {
             "status": "healthy",
             "has_data": dashboard.current_insights is not None,
-            "last_updated": dashboard.last_updated.isoformat() if dashboard.last_updated else None,
+            "last_updated": dashboard.last_updated,
         }
     
     @app.post("/api/analyze/text")
@@ -274,41 +393,21 @@ def create_app() -> FastAPI:
             )
         
         try:
-            from ..loaders.file_loader import FileLoader
-            from ..extractors.insight_extractor import InsightExtractor
-            from ..config import get_settings
-            
-            settings = get_settings()
-            
             # Create transcript from pasted text
-            loader = FileLoader()
-            transcript = loader.load_from_text(
+            transcript = await run_in_threadpool(
+                loader.load_from_text,
                 text=text,
                 rep_name=rep_name,
                 company_name=company_name,
             )
             
             # Extract insights
-            extractor = InsightExtractor(model_name=settings.openai_model)
-            result = await extractor.extract_from_transcript(transcript)
-
-            # Record this run in history
-            dashboard.history.append(result.insights)
-            if len(dashboard.history) > 20:
-                dashboard.history = dashboard.history[-20:]
-
-            # Merge into aggregated insights (current_insights)
-            if dashboard.current_insights:
-                dashboard.current_insights = _merge_call_insights(
-                    dashboard.current_insights, result.insights
-                )
-            else:
-                dashboard.current_insights = result.insights
+            result = await get_extractor().extract_from_transcript(transcript)
 
-            dashboard.last_updated = datetime.now()
-            session_index = len(dashboard.history) - 1
+            # Record this run in history and merge it into the aggregate view
+            session_index = dashboard.add_session(result.insights)
 
-            return JSONResponse({
+            return ORJSONResponse({
                 "status": "success",
                 "message": "Transcript analyzed successfully",
                 "total_insights": result.insights.total_insights,
@@ -337,64 +436,40 @@ def create_app() -> FastAPI:
             )
         
         try:
-            from ..loaders.file_loader import FileLoader
-            from ..extractors.insight_extractor import InsightExtractor
-            from ..config import get_settings
-            
-            settings = get_settings()
-            
-            # Read file content
-            content = await file.read()
-            
-            loader = FileLoader()
-            
-            if ext == ".pdf":
-                transcript = loader.load_from_pdf_bytes(
-                    pdf_bytes=content,
-                    rep_name=rep_name,
-                    company_name=company_name,
-                    filename=filename,
-                )
-            elif ext == ".txt":
-                text = content.decode("utf-8")
-                transcript = loader.load_from_text(
+            # Parsing is CPU-bound, so it runs off the event loop
+            if ext == ".txt":
+                text = (await file.read()).decode("utf-8")
+                transcript = await run_in_threadpool(
+                    loader.load_from_text,
                     text=text,
                     rep_name=rep_name,
                     company_name=company_name,
                 )
-            elif ext == ".json":
-                import json
-                import tempfile
-                # Write to temp file for JSON loader
-                with tempfile.NamedTemporaryFile(mode="wb", suffix=".json", delete=False) as tmp:
-                    tmp.write(content)
-                    tmp_path = Path(tmp.name)
+            else:
+                # PDF and JSON loaders read from disk, so stream the upload
+                # there rather than holding a second copy in memory
+                tmp_path = await run_in_threadpool(_save_upload, file, ext)
                 try:
-                    transcript = loader.load_json_transcript(tmp_path)
+                    if ext == ".pdf":
+                        transcript = await run_in_threadpool(
+                            loader.load_pdf_transcript,
+                            tmp_path,
+                            rep_name=rep_name,
+                            company_name=company_name,
+                            source_file=filename,
+                        )
+                    else:
+                        transcript = await run_in_threadpool(loader.load_json_transcript, tmp_path)
                 finally:
                     tmp_path.unlink()
             
             # Extract insights
-            extractor = InsightExtractor(model_name=settings.openai_model)
-            result = await extractor.extract_from_transcript(transcript)
-
-            # Record this run in history
-            dashboard.history.append(result.insights)
-            if len(dashboard.history) > 20:
-                dashboard.history = dashboard.history[-20:]
-
-            # Merge into aggregated insights (current_insights)
-            if dashboard.current_insights:
-                dashboard.current_insights = _merge_call_insights(
-                    dashboard.current_insights, result.insights
-                )
-            else:
-                dashboard.current_insights = result.insights
+            result = await get_extractor().extract_from_transcript(transcript)
 
-            dashboard.last_updated = datetime.now()
-            session_index = len(dashboard.history) - 1
+            # Record this run in history and merge it into the aggregate view
+            session_index = dashboard.add_session(result.insights)
 
-            return JSONResponse({
+            return ORJSONResponse({
                 "status": "success",
                 "message": f"File '{filename}' analyzed successfully",
                 "total_insights": result.insights.total_insights,
@@ -408,18 +483,81 @@ def create_app() -> FastAPI:
     return app
 
 
-def update_dashboard(insights: CallInsights, rollup: Optional[WeeklyRollup] = None):
+def _save_upload(file: UploadFile, suffix: str) -> Path:
+    """Copy an upload to a temp file in 1 MiB chunks and return its path."""
+    with tempfile.NamedTemporaryFile(mode="wb", suffix=suffix, delete=False) as tmp:
+        shutil.copyfileobj(file.file, tmp, 1 << 20)
+    return Path(tmp.name)
+
+
+def update_dashboard(
+    insights: CallInsights,
+    rollup: Optional[WeeklyRollup] = None,
+    record_history: bool = True,
+):
     """Update the global dashboard with new insights."""
-    dashboard.update(insights, rollup)
+    dashboard.update(insights, rollup, record_history=record_history)
 
 
-def run_server(host: str = "127.0.0.1", port: int = 8000):
-    """Run the dashboard server."""
+def update_dashboard_incremental(insights: CallInsights):
+    """Merge one transcript's insights into the global dashboard as they arrive."""
+    dashboard.merge(insights)
+
+
+# Seconds uvicorn waits for open connections before closing them on shutdown
+SHUTDOWN_TIMEOUT = 5
+
+
+def _build_server(host: str, port: int, log_level: str = "info"):
+    """Create a uvicorn server whose exit also ends open event streams."""
     import uvicorn
     
+    app = create_app()
+    
+    class _Server(uvicorn.Server):
+        def handle_exit(self, sig, frame):
+            app.state.shutdown.set()
+            super().handle_exit(sig, frame)
+    
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level=log_level,
+        timeout_graceful_shutdown=SHUTDOWN_TIMEOUT,
+    )
+    return _Server(config)
+
+
+class DashboardServer:
+    """Serve the dashboard from a background thread while processing continues."""
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 8000):
+        self.server = _build_server(host, port, log_level="warning")
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+    
+    def start(self):
+        """Start serving in the background."""
+        self.thread.start()
+    
+    def wait(self):
+        """Block until the server stops or the user presses Ctrl+C."""
+        try:
+            while self.thread.is_alive():
+                self.thread.join(timeout=0.5)
+        except KeyboardInterrupt:
+            # Signal handlers only run in the main thread, so stop the server here
+            self.server.config.app.state.shutdown.set()
+            self.server.should_exit = True
+            self.thread.join(timeout=SHUTDOWN_TIMEOUT + 1)
+
+
+def run_server(host: str = "127.0.0.1", port: int = 8000):
+    """Run the dashboard server."""
     host = os.getenv("WEB_HOST", host)
     port = int(os.getenv("WEB_PORT", port))
     
-    app = create_app()
-    uvicorn.run(app, host=host, port=port)
-
+    try:
+        _build_server(host, port).run()
+    except KeyboardInterrupt:
+        pass  # uvicorn re-raises Ctrl+C once shutdown completes
@@ -1,6 +1,10 @@
 """Utility functions for insight processing."""
 
-from .deduplication import deduplicate_insights, calculate_similarity
-
-__all__ = ["deduplicate_insights", "calculate_similarity"]
+from .deduplication import (
+    deduplicate_insights,
+    deduplicate_by_id,
+    deduplicate_by_embedding,
+    calculate_similarity,
+)
 
+__all__ = ["deduplicate_insights", "deduplicate_by_id", "deduplicate_by_embedding", "calculate_similarity"]
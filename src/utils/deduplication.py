@@ -1,18 +1,107 @@
 """Deduplication utilities for insights."""
 
-from difflib import SequenceMatcher
+import math
+from functools import lru_cache
 from typing import Optional
 
+from rapidfuzz import fuzz
+
 from ..models.insights import Insight, ConfidenceLevel
 
 
-def calculate_similarity(text1: str, text2: str) -> float:
-    """Calculate similarity ratio between two texts."""
+CONFIDENCE_ORDER = {
+    ConfidenceLevel.HIGH: 3,
+    ConfidenceLevel.MEDIUM: 2,
+    ConfidenceLevel.LOW: 1,
+    "high": 3,
+    "medium": 2,
+    "low": 1,
+}
+
+
+@lru_cache(maxsize=8192)
+def _ratio(a: str, b: str) -> float:
+    """Similarity (0-1) of two normalized texts, memoized.
+    
+    RapidFuzz's ratio is the normalized Indel similarity, computed in
+    native code. Repeat runs in one process (dashboard uploads,
+    reprocessing) skip pairs they've already scored.
+    """
+    return fuzz.ratio(a, b) / 100
+
+
+def _length_window(length: int, threshold: float) -> tuple[float, float]:
+    """Range of text lengths that could be at least `threshold` similar to one of `length`.
+    
+    The edit distance is at least the length difference, which caps the
+    ratio at 2 * min / (len1 + len2); texts outside the window skip the
+    comparison.
+    """
+    if threshold <= 0:
+        return 0, math.inf
+    # Pad slightly so float rounding never excludes a pair right at the bound
+    low = length * threshold / (2 - threshold) - 1e-9
+    high = length * (2 - threshold) / threshold + 1e-9
+    return low, high
+
+
+def clear_similarity_cache():
+    """Drop memoized similarity scores."""
+    _ratio.cache_clear()
+
+
+def calculate_similarity(text1: str, text2: str, min_ratio: float = 0.0) -> float:
+    """Calculate similarity ratio between two texts.
+    
+    Returns 0.0 without comparing when the lengths alone rule out
+    reaching `min_ratio`.
+    """
     # Normalize texts
     t1 = text1.lower().strip()
     t2 = text2.lower().strip()
     
-    return SequenceMatcher(None, t1, t2).ratio()
+    low, high = _length_window(len(t1), min_ratio)
+    if not low <= len(t2) <= high:
+        return 0.0
+    return _ratio(t1, t2)
+
+
+def deduplicate_by_id(
+    insights: list[Insight],
+    prefer_higher_confidence: bool = True,
+) -> list[Insight]:
+    """
+    Remove insights that share an ID, in a single pass.
+    
+    IDs hash the normalized content with the call ID, so this catches
+    exact repeats cheaply before the pairwise similarity pass. Insights
+    without an ID are always kept.
+    
+    Args:
+        insights: List of insights to deduplicate
+        prefer_higher_confidence: Whether to prefer higher confidence insights
+    
+    Returns:
+        Deduplicated list of insights
+    """
+    unique_insights: list[Insight] = []
+    index_by_id: dict[str, int] = {}
+    
+    for insight in insights:
+        if insight.id is None:
+            unique_insights.append(insight)
+            continue
+        
+        idx = index_by_id.get(insight.id)
+        if idx is None:
+            index_by_id[insight.id] = len(unique_insights)
+            unique_insights.append(insight)
+        elif prefer_higher_confidence:
+            existing = unique_insights[idx]
+            if CONFIDENCE_ORDER.get(insight.confidence, 2) > CONFIDENCE_ORDER.get(existing.confidence, 2):
+                unique_insights[idx] = insight
+    
+    return unique_insights
 
 
 def deduplicate_insights(
@@ -40,22 +129,18 @@ def deduplicate_insights(
     
     # Track which insights to keep
     unique_insights: list[Insight] = []
-    
-    confidence_order = {
-        ConfidenceLevel.HIGH: 3,
-        ConfidenceLevel.MEDIUM: 2,
-        ConfidenceLevel.LOW: 1,
-        "high": 3,
-        "medium": 2,
-        "low": 1,
-    }
+    unique_texts: list[str] = []
     
     for insight in insights:
         is_duplicate = False
         duplicate_index: Optional[int] = None
+        text = insight.content.lower().strip()
+        low, high = _length_window(len(text), similarity_threshold)
         
-        for idx, existing in enumerate(unique_insights):
-            similarity = calculate_similarity(insight.content, existing.content)
+        for idx, existing_text in enumerate(unique_texts):
+            if not low <= len(existing_text) <= high:
+                continue
+            similarity = _ratio(text, existing_text)
             
             if similarity >= similarity_threshold:
                 is_duplicate = True
@@ -65,18 +150,72 @@ def deduplicate_insights(
         if is_duplicate and duplicate_index is not None:
             if prefer_higher_confidence:
                 existing = unique_insights[duplicate_index]
-                existing_conf = confidence_order.get(existing.confidence, 2)
-                new_conf = confidence_order.get(insight.confidence, 2)
+                existing_conf = CONFIDENCE_ORDER.get(existing.confidence, 2)
+                new_conf = CONFIDENCE_ORDER.get(insight.confidence, 2)
                 
                 if new_conf > existing_conf:
                     # Replace with higher confidence insight
                     unique_insights[duplicate_index] = insight
+                    unique_texts[duplicate_index] = text
         else:
             unique_insights.append(insight)
+            unique_texts.append(text)
     
     return unique_insights
 
 
+def deduplicate_by_embedding(
+    insights: list[Insight],
+    embeddings: list[list[float]],
+    similarity_threshold: float = 0.88,
+    prefer_higher_confidence: bool = True,
+) -> list[Insight]:
+    """
+    Remove paraphrased duplicates using precomputed embeddings.
+    
+    Catches rewordings that character-level similarity misses. Each insight
+    is compared against the insights kept so far by cosine similarity; on a
+    match the higher-confidence one is kept.
+    
+    Args:
+        insights: List of insights to deduplicate
+        embeddings: One embedding vector per insight, in the same order
+        similarity_threshold: Minimum cosine similarity to consider as duplicate
+        prefer_higher_confidence: Whether to prefer higher confidence insights
+    
+    Returns:
+        Deduplicated list of insights
+    """
+    if len(insights) != len(embeddings):
+        raise ValueError("Expected one embedding per insight")
+    
+    # Normalize once so each comparison is a plain dot product
+    unit_vectors = []
+    for vector in embeddings:
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        unit_vectors.append([x / norm for x in vector])
+    
+    kept: list[Insight] = []
+    kept_vectors: list[list[float]] = []
+    
+    for insight, vector in zip(insights, unit_vectors):
+        duplicate_index: Optional[int] = None
+        for idx, existing_vector in enumerate(kept_vectors):
+            if sum(a * b for a, b in zip(vector, existing_vector)) >= similarity_threshold:
+                duplicate_index = idx
+                break
+        
+        if duplicate_index is None:
+            kept.append(insight)
+            kept_vectors.append(vector)
+        elif prefer_higher_confidence:
+            existing_conf = CONFIDENCE_ORDER.get(kept[duplicate_index].confidence, 2)
+            if CONFIDENCE_ORDER.get(insight.confidence, 2) > existing_conf:
+                kept[duplicate_index] = insight
+    
+    return kept
+
+
 def merge_similar_insights(
     insights: list[Insight],
     similarity_threshold: float = 0.6,
@@ -90,48 +229,44 @@ def merge_similar_insights(
     if len(insights) <= 1:
         return insights
     
-    # Group similar insights
-    groups: list[list[Insight]] = []
-    used = set()
+    # Group similar insights by index
+    groups: list[list[int]] = []
+    texts = [insight.content.lower().strip() for insight in insights]
+    # Rank confidences once instead of per comparison inside each group
+    ranks = [CONFIDENCE_ORDER.get(insight.confidence, 2) for insight in insights]
     
-    for i, insight in enumerate(insights):
-        if i in used:
-            continue
-        
-        group = [insight]
-        used.add(i)
+    # Each pass takes the first ungrouped insight as the anchor and only
+    # visits insights that are still ungrouped
+    lengths = [len(text) for text in texts]
+    remaining = list(range(len(insights)))
+    while remaining:
+        anchor = remaining[0]
+        group = [anchor]
+        ungrouped = []
+        low, high = _length_window(lengths[anchor], similarity_threshold)
         
-        for j, other in enumerate(insights[i+1:], start=i+1):
-            if j in used:
-                continue
-            
-            similarity = calculate_similarity(insight.content, other.content)
-            if similarity >= similarity_threshold:
-                group.append(other)
-                used.add(j)
+        for j in remaining[1:]:
+            if low <= lengths[j] <= high and _ratio(texts[anchor], texts[j]) >= similarity_threshold:
+                group.append(j)
+            else:
+                ungrouped.append(j)
         
         groups.append(group)
+        remaining = ungrouped
     
     # Merge each group
     merged = []
-    for group in groups:
-        if len(group) == 1:
-            merged.append(group[0])
+    for indices in groups:
+        if len(indices) == 1:
+            merged.append(insights[indices[0]])
         else:
             # Combine into single insight
+            group = [insights[idx] for idx in indices]
             # Use the longest content as base
             base = max(group, key=lambda x: len(x.content))
             
             # Find highest confidence
-            best_confidence = max(
-                group, 
-                key=lambda x: {"high": 3, "medium": 2, "low": 1}.get(
-                    x.confidence.value if hasattr(x.confidence, 'value') else x.confidence, 2
-                )
-            ).confidence
-            
-            # Collect all sources
-            all_calls = list(set(g.source.call_id for g in group))
+            best_confidence = insights[max(indices, key=ranks.__getitem__)].confidence
             
             merged_insight = Insight(
                 id=base.id,
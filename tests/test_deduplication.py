@@ -6,6 +6,10 @@ from datetime import datetime
 from src.utils.deduplication import (
     calculate_similarity,
     deduplicate_insights,
+    deduplicate_by_id,
+    deduplicate_by_embedding,
+    clear_similarity_cache,
+    _ratio,
 )
 from src.models.insights import Insight, SourceReference, ConfidenceLevel
 
@@ -35,7 +39,17 @@ class TestDeduplication:
             "Add HubSpot integration",
             "The pricing page is confusing"
         )
-        assert similarity < 0.3
+        assert similarity < 0.4
+    
+    def test_calculate_similarity_skips_pairs_ruled_out_by_length(self):
+        """Test that min_ratio short-circuits only when lengths cap the ratio below it."""
+        clear_similarity_cache()
+        
+        assert calculate_similarity("abcd", "abcdabcdabcd", min_ratio=0.6) == 0.0
+        assert _ratio.cache_info().misses == 0
+        # "ab" is a subsequence of "abcd", so the ratio sits exactly on the bound
+        assert calculate_similarity("abcd", "ab", min_ratio=2 / 3) == pytest.approx(2 / 3)
+        clear_similarity_cache()
     
     def test_deduplicate_removes_duplicates(self):
         """Test that deduplication removes similar insights."""
@@ -86,8 +100,62 @@ class TestDeduplication:
         assert len(deduplicated) == 1
         assert deduplicated[0].confidence == ConfidenceLevel.HIGH
     
+    def test_deduplicate_by_id_keeps_higher_confidence(self):
+        """Test that insights sharing an ID collapse to the most confident one."""
+        source = SourceReference(
+            call_id="CALL-001",
+            call_date=datetime.now(),
+            rep_name="Test Rep",
+        )
+        
+        insights = [
+            Insight(id="a1", content="Add HubSpot integration", source=source, confidence=ConfidenceLevel.LOW),
+            Insight(content="No ID", source=source),
+            Insight(id="a1", content="Add HubSpot integration", source=source, confidence=ConfidenceLevel.HIGH),
+            Insight(content="No ID", source=source),
+        ]
+        
+        deduplicated = deduplicate_by_id(insights)
+        
+        assert len(deduplicated) == 3
+        assert deduplicated[0].confidence == ConfidenceLevel.HIGH
+    
+    def test_similarity_is_memoized_per_ordered_pair(self):
+        """Test that repeat comparisons hit the cache and argument order is kept."""
+        clear_similarity_cache()
+        
+        first = calculate_similarity("Add HubSpot integration", "add hubspot sync")
+        repeat = calculate_similarity("  add HubSpot Integration ", "Add HubSpot sync")
+        calculate_similarity("add hubspot sync", "Add HubSpot integration")
+        
+        info = _ratio.cache_info()
+        assert (info.hits, info.misses) == (1, 2)
+        assert repeat == first
+        clear_similarity_cache()
+        assert _ratio.cache_info().currsize == 0
+    
     def test_deduplicate_empty_list(self):
         """Test deduplication of empty list."""
         result = deduplicate_insights([])
         assert result == []
 
+    
+    def test_deduplicate_by_embedding_drops_paraphrases(self):
+        """Test that near-parallel embeddings are treated as duplicates."""
+        source = SourceReference(
+            call_id="CALL-001",
+            call_date=datetime.now(),
+            rep_name="Test Rep",
+        )
+        
+        insights = [
+            Insight(content="Add HubSpot integration", source=source, confidence=ConfidenceLevel.LOW),
+            Insight(content="Prospect wants a HubSpot connector", source=source, confidence=ConfidenceLevel.HIGH),
+            Insight(content="The pricing page is confusing", source=source),
+        ]
+        embeddings = [[1.0, 0.0], [0.95, 0.1], [0.0, 1.0]]
+        
+        deduplicated = deduplicate_by_embedding(insights, embeddings, similarity_threshold=0.9)
+        
+        assert len(deduplicated) == 2
+        assert deduplicated[0].content == "Prospect wants a HubSpot connector"
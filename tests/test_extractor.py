@@ -0,0 +1,247 @@
+"""Tests for the insight extractor."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from langchain_core.runnables import RunnableLambda
+
+from src.extractors.insight_extractor import (
+    InsightExtractor,
+    InsightExtractionResult,
+    ThemeAnalysis,
+)
+from src.models.insights import CallInsights, Insight, SourceReference
+from src.models.transcript import (
+    CallMetadata,
+    Transcript,
+    TranscriptCollection,
+    TranscriptSegment,
+)
+
+
+def make_collection(count: int) -> TranscriptCollection:
+    """Build a collection of small transcripts."""
+    transcripts = [
+        Transcript(
+            metadata=CallMetadata(
+                call_id=f"CALL-{i:03d}",
+                call_date=datetime(2024, 12, 18),
+                rep_name="Test Rep",
+            ),
+            segments=[TranscriptSegment(speaker="prospect", text=f"Call {i} feedback")],
+        )
+        for i in range(count)
+    ]
+    return TranscriptCollection(transcripts=transcripts)
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    return InsightExtractor(max_concurrency=2)
+
+
+class TestExtractFromCollection:
+    """Test concurrent extraction across a collection."""
+
+    async def test_bounds_concurrency_and_skips_failures(self, extractor, monkeypatch):
+        """Test that calls overlap up to max_concurrency and failed calls are skipped."""
+        in_flight = 0
+        peak = 0
+
+        async def fake_extract(transcript):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+            call_id = transcript.metadata.call_id
+            if call_id == "CALL-001":
+                raise RuntimeError("rate limited")
+
+            insights = CallInsights(call_ids=[call_id])
+            insights.faq_ideas.insights.append(Insight(
+                content=f"Question from {call_id}",
+                source=SourceReference(
+                    call_id=call_id,
+                    call_date=transcript.metadata.call_date,
+                    rep_name=transcript.metadata.rep_name,
+                ),
+            ))
+            return InsightExtractionResult(insights=insights, processing_time_seconds=0.0)
+
+        monkeypatch.setattr(extractor, "extract_from_transcript", fake_extract)
+
+        result = await extractor.extract_from_collection(make_collection(4), deduplicate=False)
+
+        assert peak == 2
+        assert result.insights.call_ids == ["CALL-000", "CALL-002", "CALL-003"]
+        assert len(result.insights.faq_ideas.insights) == 3
+
+    async def test_raises_when_every_call_fails(self, extractor, monkeypatch):
+        """Test that the first error is raised if no transcript succeeds."""
+        async def fake_extract(transcript):
+            raise RuntimeError("invalid key")
+
+        monkeypatch.setattr(extractor, "extract_from_transcript", fake_extract)
+
+        with pytest.raises(RuntimeError, match="invalid key"):
+            await extractor.extract_from_collection(make_collection(2))
+
+
+class TestQuoteMatching:
+    """Test mapping extracted quotes back to transcript segments."""
+
+    def test_matches_paraphrased_and_contained_quotes(self, extractor):
+        """Test that the closest segment is found and unrelated quotes are rejected."""
+        transcript = make_collection(1).transcripts[0]
+        transcript.segments = [
+            TranscriptSegment(speaker="rep", text="Thanks for joining today."),
+            TranscriptSegment(speaker="prospect", text=""),
+            TranscriptSegment(
+                speaker="prospect",
+                text="Honestly, the HubSpot sync is the main thing we're missing right now.",
+            ),
+        ]
+
+        index = extractor._index_segments(transcript)
+
+        contained = extractor._best_segment_for_quote(index, "the HubSpot sync is the main thing")
+        paraphrased = extractor._best_segment_for_quote(index, "the hubspot sync is the main thing we miss")
+        unrelated = extractor._best_segment_for_quote(index, "pricing tiers are confusing")
+
+        assert contained is transcript.segments[2]
+        assert paraphrased is transcript.segments[2]
+        assert unrelated is None
+        assert index.matches["pricing tiers are confusing"] is None
+        assert extractor._best_segment_for_quote(index, "The HubSpot sync is the main thing!") is contained
+
+
+    def test_short_filler_segments_do_not_match(self, extractor):
+        """Test that an unrelated quote is not pinned to a filler segment."""
+        transcript = make_collection(1).transcripts[0]
+        transcript.segments = [
+            TranscriptSegment(speaker="rep", text="Right."),
+            TranscriptSegment(speaker="prospect", text="Yeah."),
+        ]
+
+        index = extractor._index_segments(transcript)
+
+        assert extractor._best_segment_for_quote(
+            index, "we really need better reporting dashboards for the team"
+        ) is None
+
+
+class TestCachedResults:
+    """Test reusing cached insights for another transcript."""
+
+    def test_semantic_hit_rematches_quotes(self, extractor):
+        """Test that quotes from a near-duplicate call are re-resolved or dropped."""
+        transcript = make_collection(1).transcripts[0]
+        transcript.segments = [
+            TranscriptSegment(speaker="prospect", speaker_name="Dana", text="We need a HubSpot sync.", start_time=65),
+        ]
+
+        def insight(quote):
+            return Insight(
+                content=f"Insight for {quote}",
+                direct_quote=quote,
+                source=SourceReference(
+                    call_id="OTHER",
+                    call_date=datetime(2024, 1, 1),
+                    rep_name="Other Rep",
+                    speaker_name="Someone Else",
+                    timestamp="12:00",
+                    quote_snippet=quote,
+                ),
+            )
+
+        cached = CallInsights(call_ids=["OTHER"])
+        cached.product_recommendations.insights.append(insight("we need a hubspot sync"))
+        cached.faq_ideas.insights.append(insight("pricing tiers are confusing"))
+
+        rebound = extractor._rebind_to_transcript(cached, transcript, rematch_quotes=True)
+
+        matched = rebound.product_recommendations.insights[0]
+        assert matched.source.speaker_name == "Dana"
+        assert matched.source.timestamp == "01:05"
+        assert matched.direct_quote == "we need a hubspot sync"
+
+        unmatched = rebound.faq_ideas.insights[0]
+        assert unmatched.direct_quote is None
+        assert unmatched.source.quote_snippet is None
+        assert unmatched.source.speaker_name is None
+        assert unmatched.source.timestamp is None
+        assert rebound.call_ids == ["CALL-000"]
+
+
+class TestInsightIds:
+    """Test the IDs used for exact-repeat deduplication."""
+
+    def test_ids_cover_full_content(self, extractor):
+        """Test that insights sharing a long opening get distinct IDs."""
+        prefix = "Add a native CRM integration for the reporting team so that "
+        hubspot = extractor._generate_insight_id(prefix + "HubSpot deals sync nightly", "CALL-001")
+        salesforce = extractor._generate_insight_id(prefix + "Salesforce deals sync nightly", "CALL-001")
+
+        assert hubspot != salesforce
+        assert hubspot == extractor._generate_insight_id(
+            "  " + prefix.upper() + "HubSpot  deals sync nightly", "CALL-001"
+        )
+
+
+class TestTranscriptTruncation:
+    """Test trimming transcripts to the input token budget."""
+
+    def test_truncates_by_tokens(self, extractor):
+        """Test that long text is cut to the token limit and short text is untouched."""
+        class WordEncoding:
+            def encode(self, text, disallowed_special=()):
+                return text.split(" ")
+
+            def decode(self, tokens):
+                return " ".join(tokens)
+
+        extractor._encoding = WordEncoding()
+        extractor.max_transcript_tokens = 5
+
+        assert extractor._truncate_transcript("short") == "short"
+        assert extractor._truncate_transcript("one two three four") == "one two three four"
+        assert extractor._truncate_transcript("a b c d e f g h") == "a b c d e"
+
+    def test_falls_back_to_characters_without_tokenizer(self, extractor):
+        """Test the character estimate used when the tokenizer can't be loaded."""
+        extractor._encoding = False
+        extractor.max_transcript_tokens = 5
+
+        assert extractor._truncate_transcript("x" * 100) == "x" * 20
+
+
+class TestWeeklyRollup:
+    """Test weekly rollup aggregation."""
+
+    async def test_counts_and_reps_cover_every_category(self, extractor):
+        """Test that reps appearing only outside product recommendations are included."""
+        extractor.rollup_chain = RunnableLambda(lambda _: ThemeAnalysis(themes=[]))
+
+        def insight(content, rep_name):
+            return Insight(
+                content=content,
+                source=SourceReference(call_id="CALL-001", call_date=datetime(2024, 12, 18), rep_name=rep_name),
+            )
+
+        insights = CallInsights(call_ids=["CALL-001", "CALL-002"])
+        insights.product_recommendations.insights.append(insight("Add SSO", "Rep B"))
+        insights.faq_ideas.insights.append(insight("Is there an API?", "Rep A"))
+        insights.faq_ideas.insights.append(insight("Do you support SAML?", "Rep B"))
+
+        rollup = await extractor.generate_weekly_rollup(
+            insights, datetime(2024, 12, 16), datetime(2024, 12, 23)
+        )
+
+        assert rollup.reps_analyzed == ["Rep A", "Rep B"]
+        assert rollup.insights_by_category["FAQ Ideas"] == 2
+        assert rollup.insights_by_category["Product Recommendations"] == 1
+        assert rollup.insights_by_category["Blog Topics"] == 0
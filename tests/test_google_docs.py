@@ -0,0 +1,90 @@
+"""Tests for the Google Docs output handler."""
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from src.outputs import google_docs
+from src.outputs.google_docs import GoogleDocsOutput
+
+
+class FakeRequest:
+    """Request stub that fails with the given statuses before succeeding."""
+    
+    def __init__(self, *statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+    
+    def execute(self, num_retries=0):
+        self.calls += 1
+        if self.statuses:
+            raise HttpError(httplib2.Response({"status": self.statuses.pop(0)}), b"")
+        return {"id": "DOC-1"}
+
+
+@pytest.fixture
+def output(monkeypatch):
+    monkeypatch.setattr(google_docs.time, "sleep", lambda _: None)
+    # Skip OAuth; only the request helpers are exercised
+    return GoogleDocsOutput.__new__(GoogleDocsOutput)
+
+
+class TestWriteRetries:
+    """Test retry behaviour for non-idempotent Google API writes."""
+    
+    def test_retries_rate_limited_writes(self, output):
+        """Test that a 429 is retried since the write was never applied."""
+        request = FakeRequest(429, 429)
+        
+        assert output._execute_write(request) == {"id": "DOC-1"}
+        assert request.calls == 3
+    
+    def test_does_not_retry_server_errors(self, output):
+        """Test that a 5xx is raised rather than risking a duplicate write."""
+        request = FakeRequest(503)
+        
+        with pytest.raises(HttpError):
+            output._execute_write(request)
+        assert request.calls == 1
+
+
+class FakeService:
+    """Drive/Docs stub returning one request per create call."""
+    
+    def __init__(self, request):
+        self.request = request
+    
+    def files(self):
+        return self
+    
+    def documents(self):
+        return self
+    
+    def create(self, **kwargs):
+        return self.request
+
+
+class TestCreateDocument:
+    """Test folder fallback when creating documents."""
+    
+    @pytest.fixture
+    def docs(self, output):
+        output.folder_id = "FOLDER-1"
+        output.drive_service = FakeService(None)
+        output.docs_service = FakeService(FakeRequest())
+        return output
+    
+    def test_falls_back_to_root_without_folder_access(self, docs):
+        """Test that a 404 on the folder creates the doc in Drive root."""
+        docs.drive_service.request = FakeRequest(404)
+        
+        docs.create_document("Insights")
+        assert docs.docs_service.request.calls == 1
+    
+    def test_server_error_does_not_create_second_doc(self, docs):
+        """Test that a 5xx is raised instead of creating a duplicate in root."""
+        docs.drive_service.request = FakeRequest(503)
+        
+        with pytest.raises(HttpError):
+            docs.create_document("Insights")
+        assert docs.docs_service.request.calls == 0
@@ -5,7 +5,12 @@ import json
 from pathlib import Path
 from datetime import datetime
 
+import httpx
+
+from src.loaders.chorus_api import ChorusAPILoader
+from src.loaders import file_loader
 from src.loaders.file_loader import FileLoader
+from src.models.transcript import Speaker
 
 
 class TestFileLoader:
@@ -67,3 +72,162 @@ class TestFileLoader:
         assert collection.total_calls == 0
         assert collection.transcripts == []
 
+    
+    def test_load_all_skips_invalid_files(self, tmp_path):
+        """Test that one unreadable file doesn't stop the batch."""
+        data = {
+            "metadata": {
+                "call_id": "TEST-001",
+                "call_date": "2024-12-18T10:30:00",
+                "rep_name": "Test Rep",
+            },
+            "segments": []
+        }
+        (tmp_path / "good.json").write_text(json.dumps(data))
+        (tmp_path / "bad.json").write_text("{not valid json")
+        
+        loader = FileLoader(data_dir=str(tmp_path), workers=2)
+        collection = loader.load_all()
+        
+        assert collection.total_calls == 1
+        assert collection.transcripts[0].metadata.call_id == "TEST-001"
+    
+    def test_load_all_reports_misencoded_text(self, tmp_path, capsys):
+        """Test that a text file that isn't UTF-8 is reported rather than loaded."""
+        (tmp_path / "latin1.txt").write_bytes("Prospect: ¿Soporte en español?".encode("latin-1"))
+        
+        loader = FileLoader(data_dir=str(tmp_path), workers=2)
+        collection = loader.load_all()
+        
+        assert collection.total_calls == 0
+        assert "latin1.txt" in capsys.readouterr().out
+    
+    def test_load_all_reuses_unchanged_directory(self, tmp_path, monkeypatch):
+        """Test that repeat loads skip parsing until a file changes."""
+        data = {
+            "metadata": {
+                "call_id": "TEST-001",
+                "call_date": "2024-12-18T10:30:00",
+                "rep_name": "Test Rep",
+            },
+            "segments": []
+        }
+        (tmp_path / "call.json").write_text(json.dumps(data))
+        
+        parsed = []
+        load_file = file_loader._load_file_safely
+        monkeypatch.setattr(file_loader, "_load_file_safely", lambda path: parsed.append(path) or load_file(path))
+        
+        loader = FileLoader(data_dir=str(tmp_path), workers=1)
+        first = loader.load_all()
+        first.transcripts.clear()
+        by_rep = loader.load_by_rep("test rep")
+        
+        assert len(parsed) == 1
+        assert by_rep.total_calls == 1
+        
+        data["metadata"]["rep_name"] = "Other Rep"
+        (tmp_path / "call.json").write_text(json.dumps(data))
+        
+        assert loader.load_all().transcripts[0].metadata.rep_name == "Other Rep"
+        assert len(parsed) == 2
+    
+    def test_load_all_with_process_pool(self, tmp_path, monkeypatch):
+        """Test that large batches load through worker processes."""
+        for i in range(3):
+            data = {
+                "metadata": {
+                    "call_id": f"TEST-{i:03d}",
+                    "call_date": f"2024-12-1{i}T10:30:00",
+                    "rep_name": "Test Rep",
+                },
+                "segments": [{"speaker": "prospect", "text": "We need SSO."}]
+            }
+            (tmp_path / f"call_{i}.json").write_text(json.dumps(data))
+        (tmp_path / "bad.json").write_text("{not valid json")
+        monkeypatch.setattr(FileLoader, "PROCESS_POOL_MIN_FILES", 2)
+        monkeypatch.setattr("os.cpu_count", lambda: 2)
+        
+        loader = FileLoader(data_dir=str(tmp_path), workers=2)
+        collection = loader.load_all()
+        
+        assert [t.metadata.call_id for t in collection.transcripts] == ["TEST-002", "TEST-001", "TEST-000"]
+        assert collection.transcripts[0].segments[0].text == "We need SSO."
+    
+    def test_parse_timestamped_text(self):
+        """Test parsing Meet-style timestamp blocks, including speakers on their own line."""
+        text = (
+            "00:00:05 Sarah Johnson\n"
+            "Thanks for joining.\n"
+            "\n"
+            "00:01:10\n"
+            "Mike Chen\n"
+            "We need a HubSpot integration.\n"
+            "Transcript\n"
+            "It's a blocker for us.\n"
+        )
+        
+        segments = FileLoader()._parse_text_segments(text, rep_name="Sarah Johnson")
+        
+        assert [(s.speaker, s.speaker_name) for s in segments] == [
+            (Speaker.REP, "Sarah Johnson"),
+            (Speaker.UNKNOWN, "Mike Chen"),
+        ]
+        assert segments[1].text == "We need a HubSpot integration. It's a blocker for us."
+        assert segments[1].start_time == 70.0
+        assert segments[1].timestamp_str == "00:01:10"
+    
+    def test_load_from_pdf_bytes(self):
+        """Test extracting a transcript from PDF bytes."""
+        pymupdf = pytest.importorskip("pymupdf")
+        
+        doc = pymupdf.open()
+        page = doc.new_page()
+        page.insert_text((72, 72), "Rep: Thanks for joining\nProspect: We need SSO")
+        pdf_bytes = doc.tobytes()
+        
+        loader = FileLoader()
+        transcript = loader.load_from_pdf_bytes(pdf_bytes, rep_name="Test Rep")
+        
+        assert "We need SSO" in transcript.full_text
+        assert transcript.metadata.rep_name == "Test Rep"
+
+
+class TestChorusAPILoader:
+    """Test the Chorus API loader's HTTP handling."""
+    
+    async def test_requests_share_one_client(self):
+        """Test that every request goes through the pooled client with auth headers."""
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            if request.url.path.endswith("/calls"):
+                return httpx.Response(200, json={"calls": [
+                    {"id": "C1", "date": "2024-12-18T10:30:00", "rep_name": "Test Rep"},
+                    {"id": "C2", "date": "2024-12-19T10:30:00", "rep_name": "Test Rep"},
+                ]})
+            return httpx.Response(200, json={"utterances": [
+                {"speaker_role": "Customer", "text": "We need SSO."},
+                {"speaker_role": "sales", "text": "Noted."},
+                {"speaker_role": None, "text": "Hello?"},
+            ]})
+        
+        async with ChorusAPILoader(api_key="test-key", api_url="https://chorus.test/v1") as loader:
+            await loader._client.aclose()
+            loader._client = httpx.AsyncClient(
+                base_url=loader._client.base_url,
+                headers=loader.headers,
+                transport=httpx.MockTransport(handler),
+            )
+            collection = await loader.load_recent(days=7)
+        
+        assert collection.total_calls == 2
+        assert [s.speaker for s in collection.transcripts[0].segments] == [
+            Speaker.PROSPECT, Speaker.REP, Speaker.UNKNOWN,
+        ]
+        assert [r.url.path for r in requests] == [
+            "/v1/calls", "/v1/calls/C1/transcript", "/v1/calls/C2/transcript",
+        ]
+        assert all(r.headers["Authorization"] == "Bearer test-key" for r in requests)
+        assert loader._client.is_closed
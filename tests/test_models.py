@@ -17,23 +17,50 @@ from src.models.insights import (
     CallInsights,
 )
 
+# Fixed call date so model tests are deterministic
+FIXED_NOW = datetime(2024, 12, 18)
+
+
+@pytest.fixture(scope="module")
+def base_metadata():
+    """Call metadata shared by tests that don't inspect it."""
+    return CallMetadata(
+        call_id="TEST-001",
+        call_date=FIXED_NOW,
+        rep_name="Test Rep",
+    )
+
+
+@pytest.fixture(scope="module")
+def base_source():
+    """Source reference shared by tests that don't inspect it."""
+    return SourceReference(
+        call_id="CALL-001",
+        call_date=FIXED_NOW,
+        rep_name="Test Rep",
+    )
+
 
 class TestTranscriptModels:
     """Test transcript data models."""
     
-    def test_transcript_segment_creation(self):
+    @pytest.mark.parametrize(
+        "start, end, expected_timestamp",
+        [(0, 5, "00:00"), (65, 70, "01:05"), (3661, 3700, "61:01"), (None, None, None)],
+    )
+    def test_transcript_segment_creation(self, start, end, expected_timestamp):
         """Test creating a transcript segment."""
         segment = TranscriptSegment(
             speaker=Speaker.REP,
             speaker_name="John",
             text="Hello, how are you?",
-            start_time=0,
-            end_time=5,
+            start_time=start,
+            end_time=end,
         )
         
         assert segment.speaker == Speaker.REP
         assert segment.text == "Hello, how are you?"
-        assert segment.timestamp == "00:00"
+        assert segment.timestamp == expected_timestamp
     
     def test_call_metadata_formatting(self):
         """Test call metadata formatting."""
@@ -48,35 +75,63 @@ class TestTranscriptModels:
         assert metadata.call_date_formatted == "2024-12-18"
         assert metadata.duration_formatted == "30m 0s"
     
-    def test_transcript_full_text(self):
+    def test_transcript_full_text(self, base_metadata):
         """Test getting full transcript text."""
-        metadata = CallMetadata(
-            call_id="TEST-001",
-            call_date=datetime.now(),
-            rep_name="Test Rep",
-        )
-        
         segments = [
             TranscriptSegment(speaker=Speaker.REP, text="Hello"),
             TranscriptSegment(speaker=Speaker.PROSPECT, text="Hi there"),
         ]
         
-        transcript = Transcript(metadata=metadata, segments=segments)
+        transcript = Transcript(metadata=base_metadata, segments=segments)
         
         assert "Hello" in transcript.full_text
         assert "Hi there" in transcript.full_text
+        assert transcript.full_text is transcript.full_text
+        assert transcript.word_count == 5
+        assert "full_text" not in transcript.model_dump()
+    
+    def test_transcript_text_cache_resets(self, base_metadata):
+        """Test that replacing segments rebuilds the cached text and word count."""
+        transcript = Transcript(
+            metadata=base_metadata,
+            segments=[TranscriptSegment(speaker=Speaker.REP, text="Hello")],
+        )
+        assert transcript.word_count == 2
+        
+        transcript.segments = [TranscriptSegment(speaker=Speaker.PROSPECT, text="We need SSO")]
+        assert "We need SSO" in transcript.full_text
+        assert "Hello" not in transcript.full_text
+        assert transcript.word_count == 4
+        
+        copy = transcript.model_copy(update={"raw_text": "REP: Replaced"})
+        assert copy.full_text == "REP: Replaced"
+        assert copy.word_count == 2
+        assert "We need SSO" in transcript.full_text
+    
+    def test_transcript_roundtrip(self, base_metadata):
+        """Test that a transcript survives a JSON dump and load unchanged."""
+        transcript = Transcript(
+            metadata=base_metadata,
+            segments=[TranscriptSegment(speaker=Speaker.PROSPECT, text="Hi there", start_time=65)],
+        )
+        transcript.full_text  # Cached values must not leak into the JSON
+        
+        restored = Transcript.model_validate_json(transcript.model_dump_json())
+        
+        assert restored == transcript
+        assert restored.segments[0].timestamp == "01:05"
     
     def test_transcript_collection_properties(self):
         """Test transcript collection properties."""
         metadata1 = CallMetadata(
             call_id="TEST-001",
-            call_date=datetime.now(),
+            call_date=FIXED_NOW,
             rep_name="Rep 1",
             company_name="Company A",
         )
         metadata2 = CallMetadata(
             call_id="TEST-002",
-            call_date=datetime.now(),
+            call_date=FIXED_NOW,
             rep_name="Rep 2",
             company_name="Company B",
         )
@@ -113,18 +168,12 @@ class TestInsightModels:
         assert "Acme Corp" in ref
         assert "@05:30" in ref
     
-    def test_insight_creation(self):
+    def test_insight_creation(self, base_source):
         """Test creating an insight."""
-        source = SourceReference(
-            call_id="CALL-001",
-            call_date=datetime.now(),
-            rep_name="Test Rep",
-        )
-        
         insight = Insight(
             content="We need HubSpot integration",
             confidence=ConfidenceLevel.HIGH,
-            source=source,
+            source=base_source,
             direct_quote="Can you integrate with HubSpot?",
         )
         
@@ -132,22 +181,16 @@ class TestInsightModels:
         assert insight.confidence == ConfidenceLevel.HIGH
         assert insight.direct_quote is not None
     
-    def test_call_insights_total_count(self):
+    def test_call_insights_total_count(self, base_source):
         """Test counting total insights."""
-        source = SourceReference(
-            call_id="CALL-001",
-            call_date=datetime.now(),
-            rep_name="Test Rep",
-        )
-        
         insights = CallInsights(call_ids=["CALL-001"])
         
         # Add some insights
         insights.product_recommendations.insights.append(
-            Insight(content="Test 1", source=source)
+            Insight(content="Test 1", source=base_source)
         )
         insights.positive_feedback.insights.append(
-            Insight(content="Test 2", source=source)
+            Insight(content="Test 2", source=base_source)
         )
         
         assert insights.total_insights == 2
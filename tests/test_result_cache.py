@@ -0,0 +1,72 @@
+"""Tests for the exact-match extraction cache."""
+
+import os
+
+import pytest
+from datetime import datetime
+
+from src.extractors.result_cache import ResultCache
+from src.models.insights import CallInsights, Insight, SourceReference
+
+
+class TestResultCache:
+    """Test on-disk result caching."""
+    
+    def test_put_then_get_roundtrip(self, tmp_path):
+        """Test that stored insights are returned for the same key."""
+        source = SourceReference(
+            call_id="CALL-001",
+            call_date=datetime(2024, 12, 18),
+            rep_name="Test Rep",
+        )
+        insights = CallInsights(call_ids=["CALL-001"])
+        insights.faq_ideas.insights.append(Insight(content="How long is onboarding?", source=source))
+        
+        cache = ResultCache(tmp_path)
+        key = ResultCache.key_for("transcript text", "gpt-4.1-mini")
+        cache.put(key, insights)
+        
+        cached = cache.get(key)
+        assert cached is not None
+        assert cached.faq_ideas.insights[0].content == "How long is onboarding?"
+        assert list(tmp_path.glob("*.tmp")) == []
+    
+    def test_key_depends_on_text_and_model(self):
+        """Test that different text or model yields a different key."""
+        key = ResultCache.key_for("transcript text", "gpt-4.1-mini")
+        
+        assert key != ResultCache.key_for("other text", "gpt-4.1-mini")
+        assert key != ResultCache.key_for("transcript text", "gpt-4o")
+    
+    def test_missing_or_corrupt_entry_is_a_miss(self, tmp_path):
+        """Test that absent or unreadable entries return None."""
+        cache = ResultCache(tmp_path)
+        (tmp_path / "broken.json").write_text("{not json")
+        
+        assert cache.get("absent") is None
+        assert cache.get("broken") is None
+    
+    def test_non_ascii_survives_non_utf8_locale(self, tmp_path, monkeypatch):
+        """Test that entries are written as UTF-8 even when text files default elsewhere."""
+        real_fdopen = os.fdopen
+        
+        def latin1_fdopen(fd, mode="r", *args, **kwargs):
+            if "b" not in mode:
+                kwargs.setdefault("encoding", "latin-1")
+            return real_fdopen(fd, mode, *args, **kwargs)
+        
+        monkeypatch.setattr(os, "fdopen", latin1_fdopen)
+        source = SourceReference(
+            call_id="CALL-001",
+            call_date=datetime(2024, 12, 18),
+            rep_name="José Müller",
+        )
+        insights = CallInsights(call_ids=["CALL-001"])
+        insights.faq_ideas.insights.append(Insight(content="¿Hay soporte en español?", source=source))
+        
+        cache = ResultCache(tmp_path)
+        cache.put("key", insights)
+        
+        cached = cache.get("key")
+        assert cached.faq_ideas.insights[0].content == "¿Hay soporte en español?"
+        assert cached.faq_ideas.insights[0].source.rep_name == "José Müller"
@@ -0,0 +1,99 @@
+"""Tests for the CLI processing pipeline."""
+
+import asyncio
+
+import pytest
+import json
+from datetime import datetime
+
+import run
+from src.extractors.insight_extractor import InsightExtractor, InsightExtractionResult
+from src.models.insights import CallInsights, Insight, SourceReference
+
+
+class TestProcessTranscripts:
+    """Test the directory processing flow in run.py."""
+
+    async def test_extracts_without_company_names(self, tmp_path, monkeypatch):
+        """Test that extraction runs when no transcript has a company name."""
+        data = {
+            "metadata": {
+                "call_id": "TEST-001",
+                "call_date": "2024-12-18T10:30:00",
+                "rep_name": "Test Rep",
+            },
+            "segments": [
+                {"speaker": "prospect", "text": "We really need a HubSpot integration."}
+            ]
+        }
+        (tmp_path / "call.json").write_text(json.dumps(data))
+
+        async def fake_extract(self, collection, deduplicate=True, on_result=None):
+            source = SourceReference(
+                call_id="TEST-001",
+                call_date=datetime(2024, 12, 18),
+                rep_name="Test Rep",
+            )
+            insights = CallInsights(call_ids=["TEST-001"])
+            insights.product_recommendations.insights.append(
+                Insight(content="Add HubSpot integration", source=source)
+            )
+            return InsightExtractionResult(insights=insights, processing_time_seconds=0.0)
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setattr(InsightExtractor, "extract_from_collection", fake_extract)
+
+        with run.RichReporter(run.console) as reporter:
+            insights, rollup = await run.process_transcripts(
+                data_dir=str(tmp_path),
+                reporter=reporter,
+                use_cache=False,
+            )
+
+        assert insights is not None
+        assert insights.total_insights > 0
+        assert rollup is None
+
+    async def test_failed_output_setup_cancels_rollup(self, tmp_path, monkeypatch):
+        """Test that the rollup is cancelled when on_extracted raises."""
+        for i in range(2):
+            data = {
+                "metadata": {
+                    "call_id": f"TEST-00{i}",
+                    "call_date": f"2024-12-1{i}T10:30:00",
+                    "rep_name": "Test Rep",
+                },
+                "segments": [{"speaker": "prospect", "text": "We need SSO."}]
+            }
+            (tmp_path / f"call_{i}.json").write_text(json.dumps(data))
+
+        async def fake_extract(self, collection, deduplicate=True, on_result=None):
+            insights = CallInsights(call_ids=["TEST-000", "TEST-001"])
+            return InsightExtractionResult(insights=insights, processing_time_seconds=0.0)
+
+        cancelled = []
+
+        async def slow_rollup(self, insights, week_start, week_end):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        def failing_setup(insights):
+            raise RuntimeError("OAuth failed")
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setattr(InsightExtractor, "extract_from_collection", fake_extract)
+        monkeypatch.setattr(InsightExtractor, "generate_weekly_rollup", slow_rollup)
+
+        with run.RichReporter(run.console) as reporter:
+            with pytest.raises(RuntimeError, match="OAuth failed"):
+                await run.process_transcripts(
+                    data_dir=str(tmp_path),
+                    reporter=reporter,
+                    use_cache=False,
+                    on_extracted=failing_setup,
+                )
+
+        assert cancelled == [True]
@@ -0,0 +1,60 @@
+"""Tests for the semantic extraction cache."""
+
+import pytest
+from datetime import datetime
+
+from src.extractors.semantic_cache import SemanticCache
+from src.models.insights import CallInsights, Insight, SourceReference
+
+
+def _make_insights(call_id: str) -> CallInsights:
+    source = SourceReference(
+        call_id=call_id,
+        call_date=datetime(2024, 12, 18),
+        rep_name="Test Rep",
+    )
+    insights = CallInsights(call_ids=[call_id])
+    insights.product_recommendations.insights.append(
+        Insight(content="Add HubSpot integration", source=source)
+    )
+    return insights
+
+
+class TestSemanticCache:
+    """Test embedding-similarity cache lookups."""
+    
+    def test_lookup_hits_similar_vector(self, tmp_path):
+        """Test that a near-identical embedding returns the cached insights."""
+        cache = SemanticCache(tmp_path / "index.jsonl", threshold=0.9)
+        cache.store([1.0, 0.0, 0.0], _make_insights("CALL-001"))
+        
+        cached = cache.lookup([0.99, 0.05, 0.0])
+        
+        assert cached is not None
+        assert cached.call_ids == ["CALL-001"]
+        assert cached.total_insights == 1
+    
+    def test_lookup_misses_dissimilar_vector(self, tmp_path):
+        """Test that an unrelated embedding is not served from cache."""
+        cache = SemanticCache(tmp_path / "index.jsonl", threshold=0.9)
+        cache.store([1.0, 0.0, 0.0], _make_insights("CALL-001"))
+        
+        assert cache.lookup([0.0, 1.0, 0.0]) is None
+    
+    def test_entries_persist_across_instances(self, tmp_path):
+        """Test that stored entries are reloaded from disk."""
+        path = tmp_path / "index.jsonl"
+        SemanticCache(path).store([0.0, 1.0], _make_insights("CALL-002"))
+        
+        cached = SemanticCache(path).lookup([0.0, 1.0])
+        
+        assert cached is not None
+        assert cached.call_ids == ["CALL-002"]
+    
+    def test_lookup_ignores_other_models(self, tmp_path):
+        """Test that entries extracted by a different model are not served."""
+        path = tmp_path / "index.jsonl"
+        SemanticCache(path, model_name="gpt-4.1-mini").store([1.0, 0.0], _make_insights("CALL-001"))
+        
+        assert SemanticCache(path, model_name="gpt-4.1").lookup([1.0, 0.0]) is None
+        assert SemanticCache(path, model_name="gpt-4.1-mini").lookup([1.0, 0.0]) is not None
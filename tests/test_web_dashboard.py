@@ -0,0 +1,182 @@
+"""Tests for web dashboard state management."""
+
+import threading
+from collections import deque
+
+import orjson
+import pytest
+from datetime import datetime
+
+from src.outputs.web_dashboard import WebDashboard
+from src.models.insights import CallInsights, Insight, SourceReference
+
+
+def _make_insights(call_id: str) -> CallInsights:
+    source = SourceReference(
+        call_id=call_id,
+        call_date=datetime(2024, 12, 18),
+        rep_name="Test Rep",
+    )
+    insights = CallInsights(call_ids=[call_id])
+    insights.product_recommendations.insights.append(
+        Insight(content=f"Insight from {call_id}", source=source)
+    )
+    return insights
+
+
+class TestWebDashboard:
+    """Test incremental dashboard updates."""
+    
+    def test_merge_accumulates_and_bumps_revision(self):
+        """Test that merged partial results accumulate in the aggregate view."""
+        dashboard = WebDashboard()
+        first = _make_insights("CALL-001")
+        
+        dashboard.merge(first)
+        dashboard.merge(_make_insights("CALL-002"))
+        dashboard.merge(_make_insights("CALL-001"))
+        
+        assert dashboard.revision == 3
+        assert dashboard.current_insights.call_ids == ["CALL-001", "CALL-002"]
+        assert dashboard.current_insights.total_insights == 3
+        # The first partial result must not be mutated by later merges
+        assert first.total_insights == 1
+    
+    def test_sessions_metadata_tracks_history(self):
+        """Test that session navigation is reused until a new session is added."""
+        dashboard = WebDashboard()
+        assert dashboard.add_session(_make_insights("CALL-001")) == 0
+        
+        first = dashboard.sessions_metadata()
+        assert dashboard.sessions_metadata() is first
+        
+        assert dashboard.add_session(_make_insights("CALL-002")) == 1
+        sessions = dashboard.sessions_metadata()
+        assert [s["label"] for s in sessions] == ["Session 1", "Session 2"]
+        assert sessions[1]["calls"] == 1
+    
+    def test_sessions_not_tagged_with_concurrent_revision(self):
+        """Test that a session added mid-build is listed on the next call."""
+        dashboard = WebDashboard()
+        dashboard.add_session(_make_insights("CALL-001"))
+        adder = threading.Thread(target=dashboard.add_session, args=(_make_insights("CALL-002"),))
+        
+        class AddingHistory(deque):
+            def __iter__(self):
+                yield from super().__iter__()
+                if adder.ident is None:
+                    adder.start()
+                    adder.join(timeout=0.2)
+        
+        dashboard.history = AddingHistory(dashboard.history, maxlen=20)
+        dashboard.sessions_metadata()
+        adder.join()
+        
+        assert [s["label"] for s in dashboard.sessions_metadata()] == ["Session 1", "Session 2"]
+    
+    def test_pipeline_run_records_one_session(self):
+        """Test that a previewed run followed by its final update is listed once."""
+        dashboard = WebDashboard()
+        merged = _make_insights("CALL-001")
+        
+        dashboard.update(merged, None, record_history=False)
+        assert dashboard.current_insights is merged
+        assert len(dashboard.history) == 0
+        
+        dashboard.update(merged)
+        assert len(dashboard.history) == 1
+        assert [s["label"] for s in dashboard.sessions_metadata()] == ["Session 1"]
+    
+    def test_history_keeps_most_recent_sessions(self):
+        """Test that old sessions are evicted once history is full."""
+        dashboard = WebDashboard()
+        for i in range(22):
+            index = dashboard.add_session(_make_insights(f"CALL-{i:03d}"))
+        
+        assert index == 19
+        assert dashboard.history[0].call_ids == ["CALL-002"]
+        
+        dashboard.update(_make_insights("CALL-100"))
+        assert len(dashboard.history) == 10
+        assert dashboard.history[-1].call_ids == ["CALL-100"]
+
+
+class TestDashboardAPI:
+    """Test the JSON API endpoints."""
+    
+    def test_insights_endpoint_serializes_datetimes(self, monkeypatch):
+        """Test that API responses render datetimes as ISO strings."""
+        from fastapi.testclient import TestClient
+        from src.outputs import web_dashboard
+        
+        state = WebDashboard()
+        state.update(_make_insights("CALL-001"))
+        state.last_updated = datetime(2024, 12, 20, 9, 30)
+        monkeypatch.setattr(web_dashboard, "dashboard", state)
+        
+        client = TestClient(web_dashboard.create_app())
+        response = client.get("/api/insights")
+        health = client.get("/health")
+        
+        assert response.status_code == 200
+        assert response.json()["last_updated"] == "2024-12-20T09:30:00"
+        assert response.json()["categories"]["product_recommendations"][0]["content"] == "Insight from CALL-001"
+        assert health.json()["last_updated"] == "2024-12-20T09:30:00"
+    
+    def test_payload_not_tagged_with_concurrent_revision(self, monkeypatch):
+        """Test that a merge landing mid-build doesn't cache the old body as current."""
+        from src.outputs import web_dashboard
+        
+        state = WebDashboard()
+        state.merge(_make_insights("CALL-001"))
+        real_dumps = web_dashboard.orjson.dumps
+        merger = threading.Thread(target=state.merge, args=(_make_insights("CALL-002"),))
+        
+        def dumps_during_merge(*args, **kwargs):
+            merger.start()
+            merger.join(timeout=0.2)
+            return real_dumps(*args, **kwargs)
+        
+        monkeypatch.setattr(web_dashboard.orjson, "dumps", dumps_during_merge)
+        state.insights_payload()
+        monkeypatch.setattr(web_dashboard.orjson, "dumps", real_dumps)
+        merger.join()
+        
+        _, body = state.insights_payload()
+        assert orjson.loads(body)["total_calls"] == 2
+    
+    def test_event_stream_ends_on_shutdown(self, monkeypatch):
+        """Test that an open event stream closes once the server is shutting down."""
+        from fastapi.testclient import TestClient
+        from src.outputs import web_dashboard
+        
+        monkeypatch.setattr(web_dashboard, "dashboard", WebDashboard())
+        app = web_dashboard.create_app()
+        client = TestClient(app)
+        
+        # TestClient buffers the whole stream, so this returns only once it ends
+        timer = threading.Timer(0.2, app.state.shutdown.set)
+        timer.start()
+        response = client.get("/api/events")
+        timer.join()
+        
+        assert response.text == "data: 0\n\n"
+    
+    def test_insights_endpoint_honors_etag(self, monkeypatch):
+        """Test that an unchanged dashboard answers a matching If-None-Match with 304."""
+        from fastapi.testclient import TestClient
+        from src.outputs import web_dashboard
+        
+        state = WebDashboard()
+        state.merge(_make_insights("CALL-001"))
+        monkeypatch.setattr(web_dashboard, "dashboard", state)
+        client = TestClient(web_dashboard.create_app())
+        
+        first = client.get("/api/insights")
+        etag = first.headers["etag"]
+        assert client.get("/api/insights", headers={"If-None-Match": etag}).status_code == 304
+        
+        state.merge(_make_insights("CALL-002"))
+        changed = client.get("/api/insights", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["total_calls"] == 2